@@ -0,0 +1,8 @@
+"""Put agent-claude/ on sys.path once per interpreter (import for side effect)."""
+import os
+import sys
+
+AGENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agent-claude")
+
+if AGENT_DIR not in sys.path:
+    sys.path.insert(0, AGENT_DIR)
@@ -0,0 +1,60 @@
+"""
+Cached PDF text extraction for the workroom test scripts.
+
+Extraction is deterministic for a given file, so the parsed text is memoised
+in-process and persisted under Tests/.cache/ keyed by the file's name, size
+and mtime. A second script run (or a sibling script) skips pypdf entirely.
+"""
+
+import functools
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+import _bootstrap  # noqa: F401  (puts agent-claude/ on sys.path)
+from utils.file_parser import extract_text_from_file
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+
+@functools.lru_cache(maxsize=8)
+def cached_extract(path: str, mtime_ns: int, size: int) -> str:
+    """Return extracted text for *path*; (mtime_ns, size) invalidate the cache."""
+    pdf_path = Path(path)
+    key = hashlib.blake2b(
+        f"{pdf_path.name}:{size}:{mtime_ns}".encode(), digest_size=16,
+    ).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding="utf-8")
+
+    doc_text = _extract_mapped(pdf_path)
+    # Never persist parser error placeholders — retry on the next run instead
+    if not doc_text.startswith("[PDF extraction"):
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_file.write_text(doc_text, encoding="utf-8")
+    return doc_text
+
+
+def _extract_mapped(pdf_path: Path) -> str:
+    """Parse the PDF through a read-only mmap instead of a full bytes copy.
+
+    The file is read once per cache miss, so afterwards its pages are
+    released and the kernel is told it may evict them from the page cache.
+    """
+    with open(pdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        doc_text = extract_text_from_file(mm, pdf_path.name)
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+            mm.madvise(mmap.MADV_DONTNEED)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return doc_text
+
+
+def load_pdf_text(pdf_path: Path) -> str:
+    """Stat *pdf_path* and return its (cached) extracted text."""
+    st = pdf_path.stat()
+    return cached_extract(str(pdf_path), st.st_mtime_ns, st.st_size)
@@ -0,0 +1,60 @@
+"""
+Shared agent registry for the workroom test scripts.
+
+The built-in registry is a module-level constant so every script reads the
+same immutable entries; the custom-agent extension is memoised on the
+custom_agents.json version so repeated calls in one process hit storage once.
+"""
+
+import functools
+from types import MappingProxyType
+from typing import Final
+
+AGENT_EMOJIS: Final = MappingProxyType({
+    "intake":     "\U0001f4e5",
+    "planner":    "\U0001f4c5",
+    "analyst":    "\U0001f4ca",
+    "challenger": "\u2694\ufe0f",
+    "writer":     "\u270d\ufe0f",
+    "researcher": "\U0001f50d",
+})
+
+# (key, label, tier, description) — emojis come from AGENT_EMOJIS
+_BASE_AGENTS = (
+    ("intake",     "Intake",     1, "Log requests - Process files - Document Q&A"),
+    ("planner",    "Planner",    1, "Plan your day - Synthesise priorities"),
+    ("analyst",    "Analyst",    1, "Trends - Gaps - Risks - Decisions"),
+    ("challenger", "Challenger", 2, "Red-team ideas - Argue the opposing view"),
+    ("writer",     "Writer",     2, "Draft emails - Teams messages - Exec briefs"),
+    ("researcher", "Researcher", 2, "Deep dives - Industry context - Customer background"),
+)
+
+BASE_AGENT_REGISTRY = tuple(
+    MappingProxyType({"key": k, "label": l, "emoji": AGENT_EMOJIS[k], "tier": t, "description": d})
+    for k, l, t, d in _BASE_AGENTS
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_for_version(storage, version: int) -> tuple:
+    custom = tuple(
+        MappingProxyType({
+            "key": ca.key, "label": ca.label, "emoji": ca.emoji,
+            "tier": 3, "description": ca.effective_description,
+        })
+        for ca in storage.list_custom_agents()
+    )
+    return BASE_AGENT_REGISTRY + custom
+
+
+def get_full_registry(storage) -> list:
+    """Return built-in + custom agents as a fresh list of read-only entries."""
+    return list(_registry_for_version(storage, storage.custom_agents_version()))
+
+
+def select_agents(all_agents, keys) -> list:
+    """Resolve *keys* to registry entries in key order (first entry per key wins)."""
+    by_key: dict = {}
+    for a in all_agents:
+        by_key.setdefault(a["key"], a)
+    return [by_key[k] for k in keys if k in by_key]
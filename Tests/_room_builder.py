@@ -0,0 +1,133 @@
+"""
+Shared builder for the PRD-backed test workrooms (Test ROOM 2 / Test ROOM 3).
+
+Runs the same flow as the 3-step wizard (steps 1 and 2 run concurrently):
+  1. Parse the PRD PDF from Tests/
+  2. TopicClassifier recommends agents
+  3. Create the WorkroomSession + FacilitatorAgent opens the session
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import _bootstrap  # noqa: F401  (puts agent-claude/ on sys.path)
+from storage import StorageManager
+from models.workroom import WorkroomSession
+from _pdf_cache import load_pdf_text
+from _registry import get_full_registry, select_agents
+
+PDF_PATH = Path(__file__).resolve().parent / "Pre-Claim Denial Intelligence PRD.doc.pdf"
+
+DENIAL_OBJECTIVE = (
+    "Customer has shared the business requirement for the Denial Intelligence, "
+    "and more specifically, the models that they need help with. "
+    "Discuss the requirement and define the model requirements."
+)
+DENIAL_OUTCOME = "Draft model requirement document + follow-up questions with customer"
+
+
+def build_room(
+    title: str,
+    topic: str,
+    objective: str,
+    outcome: str,
+    *,
+    persist_doc_context: bool,
+    list_agents: bool = False,
+) -> WorkroomSession:
+    """Create a test workroom seeded with the PRD upload and facilitator opening.
+
+    When persist_doc_context is True the workroom gets a document_context
+    reference to the parsed PDF text (held in the storage blob store).
+    """
+    print(f"Topic:     {topic}")
+    print(f"Objective: {objective}")
+    print(f"Outcome:   {outcome}")
+
+    storage = StorageManager()
+    all_agents = get_full_registry(storage)
+
+    if list_agents:
+        print(f"\nTotal agents available: {len(all_agents)}")
+        sys.stdout.write("".join(
+            f"  [{a['tier']}] {a['emoji']} {a['key']}: {a['description'][:60]}\n" for a in all_agents
+        ))
+
+    # The classifier only needs the topic and registry, so the PDF parse and
+    # the LLM round-trip are independent — overlap them.
+    print("\nParsing PDF and running TopicClassifier...")
+    from agents.topic_classifier import TopicClassifier  # deferred: pulls in agno/openai
+    classifier = TopicClassifier()
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_doc = ex.submit(load_pdf_text, PDF_PATH)
+        fut_cls = ex.submit(
+            classifier.classify,
+            topic=topic, objective=objective, outcome=outcome,
+            available_agents=all_agents,
+        )
+        doc_text = fut_doc.result()
+        result = fut_cls.result()
+    print(f"PDF parsed: {len(doc_text):,} chars")
+    recommended = result.get("recommended", [])
+    rationale = result.get("rationale", {})
+
+    print(f"Recommended agents: {recommended}")
+    sys.stdout.write("".join(f"  {k}: {v}\n" for k, v in rationale.items()))
+
+    # Create workroom
+    full_goal = f"{objective}\n\nDesired outcome: {outcome}"
+    final_agents = recommended if recommended else ["intake", "analyst", "writer"]
+
+    doc_context = None
+    if persist_doc_context:
+        # Text goes to the blob store; the workroom record only keeps a reference
+        doc_context = storage.store_document_context({
+            "filename": PDF_PATH.name,
+            "text": doc_text,
+        })
+
+    new_ws = WorkroomSession(
+        title=title,
+        goal=full_goal,
+        key_outcome=outcome,
+        mode="work",
+        output_type="requirements",
+        active_agents=final_agents,
+        topic_description=topic,
+        ai_recommended_agents=recommended,
+        facilitator_enabled=True,
+        facilitator_intro_sent=True,
+        document_context=doc_context,
+    )
+    storage.save_workroom(new_ws)
+    print(f"\nWorkroom created: id={new_ws.id}")
+    if doc_context:
+        print(f"Document context persisted: {doc_context['filename']} ({doc_context['size']:,} chars)")
+
+    # Initial messages
+    init_msgs = []
+    init_msgs.append({
+        "role": "user",
+        "content": f"Material uploaded: **{PDF_PATH.name}**\n\nThis document is available as context for our discussion.",
+    })
+
+    print("FacilitatorAgent opening session...")
+    from agents.facilitator_agent import FacilitatorAgent  # deferred: pulls in agno/openai
+    facilitator = FacilitatorAgent()
+    agent_details = select_agents(all_agents, new_ws.active_agents)
+    opening_msg = facilitator.open_session(new_ws, agent_details)
+    print(f"\n--- Facilitator Opening ---\n{opening_msg}\n---")
+
+    init_msgs.append({
+        "role": "assistant",
+        "content": opening_msg,
+        "agent": "Facilitator",
+    })
+
+    storage.save_workroom_messages(new_ws.id, init_msgs)
+
+    print(f"\nDONE - Workroom '{new_ws.title}' (id: {new_ws.id}) is ready.")
+    print(f"Messages saved: {len(init_msgs)}")
+    print(f"Active agents: {final_agents}")
+    return new_ws
@@ -1,21 +1,12 @@
 """Complete the facilitator opening for Test ROOM 1."""
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agent-claude"))
+import _bootstrap  # noqa: F401  (puts agent-claude/ on sys.path)
 
 from storage import StorageManager
-from agents.facilitator_agent import FacilitatorAgent
+from _registry import get_full_registry, select_agents
 
 def main():
     storage = StorageManager()
-    workrooms = storage.list_workrooms()
-    ws = None
-    for w in workrooms:
-        if w.title == "Test ROOM 1":
-            ws = w
-            break
-
+    ws = storage.get_workroom_by_title("Test ROOM 1")
     if not ws:
         print("ERROR: Test ROOM 1 not found")
         return
@@ -29,20 +20,7 @@ def main():
         print(f"Messages already exist ({len(existing)}), skipping.")
         return
 
-    AGENT_REGISTRY = [
-        {"key": "intake",     "label": "Intake",      "emoji": "\U0001f4e5", "tier": 1, "description": "Log requests - Process files - Document Q&A"},
-        {"key": "planner",    "label": "Planner",     "emoji": "\U0001f4c5", "tier": 1, "description": "Plan your day - Synthesise priorities"},
-        {"key": "analyst",    "label": "Analyst",     "emoji": "\U0001f4ca", "tier": 1, "description": "Trends - Gaps - Risks - Decisions"},
-        {"key": "challenger", "label": "Challenger",  "emoji": "\u2694\ufe0f",  "tier": 2, "description": "Red-team ideas - Argue the opposing view"},
-        {"key": "writer",     "label": "Writer",      "emoji": "\u270d\ufe0f",  "tier": 2, "description": "Draft emails - Teams messages - Exec briefs"},
-        {"key": "researcher", "label": "Researcher",  "emoji": "\U0001f50d", "tier": 2, "description": "Deep dives - Industry context - Customer background"},
-    ]
-
-    for ca in storage.list_custom_agents():
-        AGENT_REGISTRY.append({
-            "key": ca.key, "label": ca.label, "emoji": ca.emoji,
-            "tier": 3, "description": ca.description or ca.system_prompt[:80],
-        })
+    all_agents = get_full_registry(storage)
 
     init_msgs = []
 
@@ -53,8 +31,9 @@ def main():
     })
 
     print("Running FacilitatorAgent.open_session...")
+    from agents.facilitator_agent import FacilitatorAgent  # deferred: pulls in agno/openai
     facilitator = FacilitatorAgent()
-    agent_details = [a for a in AGENT_REGISTRY if a["key"] in ws.active_agents]
+    agent_details = select_agents(all_agents, ws.active_agents)
     opening_msg = facilitator.open_session(ws, agent_details)
     print(f"\n--- Facilitator Opening ---\n{opening_msg}\n---")
 
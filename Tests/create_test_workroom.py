@@ -10,16 +10,13 @@ Simulates the full 3-step wizard flow:
 import sys
 from pathlib import Path
 
-# Ensure agent-claude is on path
-agent_dir = Path(__file__).resolve().parent.parent / "agent-claude"
-sys.path.insert(0, str(agent_dir))
+import _bootstrap  # noqa: F401  (puts agent-claude/ on sys.path)
 
 from config import OPENAI_API_KEY
 from storage import StorageManager
 from models.workroom import WorkroomSession
-from agents.topic_classifier import TopicClassifier
-from agents.facilitator_agent import FacilitatorAgent
-from utils.file_parser import extract_text_from_file
+from _pdf_cache import load_pdf_text
+from _registry import get_full_registry, select_agents
 
 
 def main():
@@ -38,35 +35,15 @@ def main():
 
     # ---- Read the PDF ----
     pdf_path = Path(__file__).resolve().parent / "Pre-Claim Denial Intelligence PRD.doc.pdf"
-    pdf_bytes = pdf_path.read_bytes()
-    doc_text = extract_text_from_file(pdf_bytes, pdf_path.name)
+    doc_text = load_pdf_text(pdf_path)
     print(f"\nPDF parsed: {len(doc_text):,} chars")
 
     # ---- Step 2: TopicClassifier ----
-    AGENT_REGISTRY = [
-        {"key": "intake",     "label": "Intake",      "emoji": "\U0001f4e5", "tier": 1,
-         "description": "Log requests - Process files - Document Q&A"},
-        {"key": "planner",    "label": "Planner",     "emoji": "\U0001f4c5", "tier": 1,
-         "description": "Plan your day - Synthesise priorities"},
-        {"key": "analyst",    "label": "Analyst",     "emoji": "\U0001f4ca", "tier": 1,
-         "description": "Trends - Gaps - Risks - Decisions"},
-        {"key": "challenger", "label": "Challenger",  "emoji": "\u2694\ufe0f",  "tier": 2,
-         "description": "Red-team ideas - Argue the opposing view"},
-        {"key": "writer",     "label": "Writer",      "emoji": "\u270d\ufe0f",  "tier": 2,
-         "description": "Draft emails - Teams messages - Exec briefs"},
-        {"key": "researcher", "label": "Researcher",  "emoji": "\U0001f50d", "tier": 2,
-         "description": "Deep dives - Industry context - Customer background"},
-    ]
-
     storage = StorageManager()
-    all_agents = list(AGENT_REGISTRY)
-    for ca in storage.list_custom_agents():
-        all_agents.append({
-            "key": ca.key, "label": ca.label, "emoji": ca.emoji,
-            "tier": 3, "description": ca.description or ca.system_prompt[:80],
-        })
+    all_agents = get_full_registry(storage)
 
     print("\nRunning TopicClassifier...")
+    from agents.topic_classifier import TopicClassifier  # deferred: pulls in agno/openai
     classifier = TopicClassifier()
     result = classifier.classify(
         topic=topic, objective=objective, outcome=outcome,
@@ -76,8 +53,7 @@ def main():
     rationale = result.get("rationale", {})
 
     print(f"Recommended agents: {recommended}")
-    for k, v in rationale.items():
-        print(f"  {k}: {v}")
+    sys.stdout.write("".join(f"  {k}: {v}\n" for k, v in rationale.items()))
 
     # ---- Step 3: Create workroom + facilitator opening ----
     full_goal = f"{objective}\n\nDesired outcome: {outcome}"
@@ -109,8 +85,9 @@ def main():
 
     # Facilitator opening
     print("FacilitatorAgent opening session...")
+    from agents.facilitator_agent import FacilitatorAgent  # deferred: pulls in agno/openai
     facilitator = FacilitatorAgent()
-    agent_details = [a for a in all_agents if a["key"] in new_ws.active_agents]
+    agent_details = select_agents(all_agents, new_ws.active_agents)
     opening_msg = facilitator.open_session(new_ws, agent_details)
     print(f"\n--- Facilitator Opening ---\n{opening_msg}\n---")
 
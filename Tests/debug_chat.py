@@ -1,26 +1,46 @@
-"""Debug script: test sending a message in the test workroom."""
+"""Debug script: test sending a message in the test workroom.
+
+Usage:
+    python Tests/debug_chat.py [--no-history] [--limit N]
+"""
+import argparse
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agent-claude"))
+import _bootstrap  # noqa: F401  (puts agent-claude/ on sys.path)
 
 from storage import StorageManager
-from agents import Orchestrator
+
+WORKROOM_ID = "8d713c30"
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--no-history", action="store_true",
+                    help="send with an empty conversation history (skips the message load)")
+parser.add_argument("--limit", type=int, default=50, metavar="N",
+                    help="number of most recent messages to send as history (default: 50)")
+args = parser.parse_args()
 
 storage = StorageManager()
-orch = Orchestrator(storage)
 
-ws = storage.get_workroom("8d713c30")
+ws = storage.get_workroom(WORKROOM_ID)
 if not ws:
-    print("Workroom 8d713c30 not found")
+    print(f"Workroom {WORKROOM_ID} not found")
     sys.exit(1)
 
+# Deferred until the workroom exists: agents pull in agno/openai at import time
+from agents import Orchestrator
+
+orch = Orchestrator(storage)
+
 print(f"Workroom: {ws.title}")
 print(f"Active agents: {ws.active_agents}")
 print(f"Discussion mode: {ws.discussion_mode}")
 
-msgs = storage.load_workroom_messages("8d713c30")
-print(f"Existing messages: {len(msgs)}")
+if args.no_history:
+    msgs = []
+    print("Existing messages: skipped (--no-history)")
+else:
+    msgs = storage.load_recent_workroom_messages(WORKROOM_ID, limit=args.limit)
+    print(f"Existing messages: {storage.count_workroom_messages(WORKROOM_ID)} (using last {len(msgs)})")
 
 test_msg = "What are the key requirements for the denial prediction model?"
 print(f"\nSending: {test_msg}")
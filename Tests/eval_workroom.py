@@ -6,27 +6,50 @@ measures routing accuracy, response quality, and decision-detection precision.
 
 Usage:
     python3 Tests/eval_workroom.py              # Run eval, print report, save results
+    python3 Tests/eval_workroom.py --parallel    # Send standalone turns concurrently
     python3 Tests/eval_workroom.py --history     # Print past results only
+    python3 Tests/eval_workroom.py --verbose     # Print every response even when piped
 
-Results are appended to Tests/eval_results.json after each run.
+Per-response previews are printed on an interactive terminal (or with
+--verbose); redirected runs print only the per-turn summary and scorecard.
+
+Results are appended to Tests/eval_results.jsonl (one JSON record per line)
+after each run.
 """
 
+import functools
 import json
+import pickle
 import re
 import sys
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:  # faster history encode/decode; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 TESTS_DIR = Path(__file__).resolve().parent
-RESULTS_FILE = TESTS_DIR / "eval_results.json"
+RESULTS_FILE = TESTS_DIR / "eval_results.jsonl"
+LEGACY_RESULTS_FILE = TESTS_DIR / "eval_results.json"  # pre-JSONL array format
+HISTORY_CACHE_FILE = TESTS_DIR / ".eval_results.cache.pkl"  # (mtime_ns, summaries)
+VERBOSE = sys.stdout.isatty() or "--verbose" in sys.argv  # per-response previews
 
 agent_dir = TESTS_DIR.parent / "agent-claude"
 sys.path.insert(0, str(agent_dir))
 
 from storage import StorageManager
-from agents.orchestrator import Orchestrator, _is_decision
+from agents.orchestrator import (
+    DECISION_KEYWORDS_STRONG,
+    DECISION_KEYWORDS_WEAK,
+    Orchestrator,
+    _DECISION_MIN_LENGTH,
+    _is_decision,
+)
 
 
 # ================================================================== #
@@ -45,6 +68,8 @@ THRESHOLDS = {
 # Test messages                                                       #
 # ================================================================== #
 
+# "standalone" turns don't need the preceding answers to be routed meaningfully;
+# with --parallel they are sent up front against the opening history only.
 TEST_MESSAGES = [
     {
         "id": "Q1",
@@ -60,6 +85,7 @@ TEST_MESSAGES = [
         "label": "Conversational acknowledgement",
         "message": "Good questions to start. Please continue.",
         "expect": "smart_route",
+        "standalone": True,
     },
     {
         "id": "Q3",
@@ -75,6 +101,7 @@ TEST_MESSAGES = [
             "from the science perspective in building the prediction model?"
         ),
         "expect": "single_route",
+        "standalone": True,
     },
     {
         "id": "Q5",
@@ -92,35 +119,50 @@ TEST_MESSAGES = [
         "label": "Short conversational turn",
         "message": "Good question. Please continue.",
         "expect": "smart_route",
+        "standalone": True,
     },
 ]
 
+# Per-turn header block, built once
+for _t in TEST_MESSAGES:
+    _display = _t["message"][:100] + ("..." if len(_t["message"]) > 100 else "")
+    _t["_header"] = (
+        f"\n  \U0001f9ea {_t['id']}: {_t['label']}\n"
+        f"  \U0001f4e4 User: \"{_display}\"\n"
+        f"  \U0001f4cb Expected: {_t['expect']}"
+    )
+del _t, _display
+
 
 # ================================================================== #
 # Metric helpers                                                      #
 # ================================================================== #
 
+_RE_MD_STRIP = re.compile(r'\*\*|\*|`|#{1,6}\s')
+_RE_NL = re.compile(r'\n+')
+_RE_SENT = re.compile(r'[.!?]+')
+# Headers, bullets, numbered lists, or "**Label**:" at the start of a line
+_RE_STRUCT = re.compile(r'#{1,6}\s|\s*[-*]\s|\s*\d+\.\s|\*\*[A-Z].*?\*\*:')
+# Any decision keyword at all — a necessary condition for _is_decision, checked
+# in one search so most conversational replies never reach the full detector.
+_RE_DECISION_TRIGGER = re.compile("|".join(DECISION_KEYWORDS_STRONG + DECISION_KEYWORDS_WEAK))
+
+
 def count_sentences(text: str) -> int:
     """Rough sentence count via period/question/exclamation splitting."""
-    clean = re.sub(r'\*\*|\*|`|#{1,6}\s', '', text)
-    clean = re.sub(r'\n+', ' ', clean)
-    sents = re.split(r'[.!?]+', clean)
+    # Plain prose (the common case) has no markdown to strip
+    if '*' in text or '`' in text or '#' in text:
+        clean = _RE_MD_STRIP.sub('', text)
+    else:
+        clean = text
+    clean = _RE_NL.sub(' ', clean)
+    sents = _RE_SENT.split(clean)
     return len([s for s in sents if s.strip() and len(s.strip()) > 10])
 
 
 def has_structured_formatting(text: str) -> bool:
     """Check if response uses headers, bullets, or numbered lists."""
-    patterns = [
-        r'^#{1,6}\s',
-        r'^\s*[-*]\s',
-        r'^\s*\d+\.\s',
-        r'\*\*[A-Z].*?\*\*:',
-    ]
-    for line in text.split('\n'):
-        for p in patterns:
-            if re.match(p, line.strip()):
-                return True
-    return False
+    return any(_RE_STRUCT.match(line.strip()) for line in text.split('\n'))
 
 
 def has_takeaway(text: str) -> bool:
@@ -128,14 +170,26 @@ def has_takeaway(text: str) -> bool:
     return '\u2192' in text  # →
 
 
+# Repeated replies (e.g. the same fallback text) reuse the earlier verdict
+_is_decision_cached = functools.lru_cache(maxsize=256)(_is_decision)
+
+
+def _maybe_decision(text: str) -> bool:
+    """_is_decision, skipped for short or keyword-free text (same result)."""
+    if len(text) < _DECISION_MIN_LENGTH or not _RE_DECISION_TRIGGER.search(text.lower()):
+        return False
+    return _is_decision_cached(text)
+
+
 def evaluate_response(text: str) -> dict:
     """Return per-response metrics dict."""
+    n_sents = count_sentences(text)
     return {
-        "sentences": count_sentences(text),
-        "concise": count_sentences(text) <= 6,
+        "sentences": n_sents,
+        "concise": n_sents <= 6,
         "has_structure": has_structured_formatting(text),
         "has_takeaway": has_takeaway(text),
-        "is_decision": _is_decision(text),
+        "is_decision": _maybe_decision(text),
         "char_count": len(text),
     }
 
@@ -144,13 +198,27 @@ def evaluate_response(text: str) -> dict:
 # Display helpers                                                     #
 # ================================================================== #
 
-def _divider(char='\u2501', width=80):
-    print(char * width)
+_DIVIDER_LINE = '\u2501' * 80
+_RULE_80 = "=" * 80
+_RULE_96 = "=" * 96
+_RULE_40 = "=" * 40
+_THIN_RULE_50 = "\u2500" * 50
+_HISTORY_RULE = "  " + " ".join("\u2500" * w for w in (4, 22, 8, 10, 10, 8, 8, 8))
+# One wrapper for every response (wrap() keeps no per-call state on it)
+_WRAPPER = textwrap.TextWrapper(
+    width=76, initial_indent='     ', subsequent_indent='     ',
+    break_long_words=False, break_on_hyphens=False,
+)
+
+
+def _divider():
+    print(_DIVIDER_LINE)
 
 
 def _print_response(label: str, text: str, metrics: dict):
     print(f"\n  \U0001f4ce {label}")
-    wrapped = textwrap.fill(text, width=76, initial_indent='     ', subsequent_indent='     ')
+    # Only the first 600 chars are shown, so don't wrap the rest
+    wrapped = _WRAPPER.fill(text[:600])
     print(wrapped[:600])
     if len(text) > 600:
         print(f"     ...({len(text)} total chars)")
@@ -166,30 +234,60 @@ def _print_response(label: str, text: str, metrics: dict):
 # Core evaluation runner                                              #
 # ================================================================== #
 
-def run_evaluation() -> dict:
-    """Execute the full eval suite and return a structured result dict."""
+def _send(orch, test: dict, history: list[dict], common_kwargs: dict) -> tuple[dict, float]:
+    """Send one test message; return (result, elapsed seconds)."""
+    t0 = time.perf_counter()
+    result = orch.handle_message(test['message'], conversation_history=history, **common_kwargs)
+    return result, time.perf_counter() - t0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orchestrator() -> tuple[StorageManager, Orchestrator]:
+    """Shared (storage, orchestrator) pair for repeated in-process runs."""
     storage = StorageManager()
-    orch = Orchestrator(storage)
+    return storage, Orchestrator(storage)
 
-    # Find the test workroom with document context
-    active_ws = None
-    for ws in storage.list_workrooms(include_archived=True):
-        if ws.document_context and ws.active_agents:
-            active_ws = ws
-            break
 
+def run_evaluation(parallel: bool = False, reload: bool = False) -> dict:
+    """Execute the full eval suite and return a structured result dict.
+
+    With parallel=True, standalone turns are dispatched concurrently with the
+    rest of the conversation; dependent turns still run in order with the
+    full history (including the standalone answers, which are awaited first).
+    reload=True discards the memoised storage/orchestrator first.
+    """
+    if reload:
+        _get_orchestrator.cache_clear()
+    storage, orch = _get_orchestrator()
+
+    # Find the test workroom with document context
+    active_ws = storage.find_workroom_with_document_context(include_archived=True)
     if not active_ws:
         print("ERROR: No workroom found with document_context.")
         sys.exit(1)
 
-    print("=" * 80)
+    print(_RULE_80)
     print("  WORKROOM CONVERSATION EVALUATION")
-    print("=" * 80)
+    print(_RULE_80)
     print(f"\n  Workroom : {active_ws.title} (id: {active_ws.id})")
     print(f"  Agents   : {active_ws.active_agents}")
     print(f"  Document : {active_ws.document_context.get('filename', '?')}")
     print(f"  Goal     : {active_ws.goal[:100]}...")
 
+    # Resolved once (blob read) and shared by every turn; the orchestrator
+    # slices the text per agent call, so there is no per-turn prep to overlap.
+    document_context = storage.resolve_document_context(active_ws.document_context)
+
+    # Turn-invariant handle_message arguments
+    common_kwargs = dict(
+        file_bytes=None,
+        filename="",
+        date="2026-02-27",
+        document_context=document_context,
+        active_agents=active_ws.active_agents,
+        workroom=active_ws,
+    )
+
     # Conversation history (reset each run)
     msgs: list[dict] = [
         {"role": "assistant", "content": "Welcome to the workroom session.", "agent": "Facilitator"}
@@ -197,30 +295,31 @@ def run_evaluation() -> dict:
 
     # Accumulators
     question_results: list[dict] = []
-    all_response_metrics: list[dict] = []
+    total_responses = concise_pass = no_struct_pass = takeaway_pass = decision_count = 0
     fallback_hits = 0
     total_time = 0.0
+    wall_t0 = time.perf_counter()
+
+    pool = ThreadPoolExecutor(max_workers=len(TEST_MESSAGES)) if parallel else None
+    prefetched = {}
+    if pool:
+        for test in TEST_MESSAGES:
+            if test.get("standalone"):
+                snapshot = [*msgs, {"role": "user", "content": test['message']}]
+                prefetched[test["id"]] = pool.submit(
+                    _send, orch, test, snapshot, common_kwargs,
+                )
 
     for test in TEST_MESSAGES:
         _divider()
-        print(f"\n  \U0001f9ea {test['id']}: {test['label']}")
-        print(f"  \U0001f4e4 User: \"{test['message'][:100]}{'...' if len(test['message']) > 100 else ''}\"")
-        print(f"  \U0001f4cb Expected: {test['expect']}")
+        print(test["_header"])
 
         msgs.append({"role": "user", "content": test['message']})
 
-        t0 = time.time()
-        result = orch.handle_message(
-            test['message'],
-            file_bytes=None,
-            filename="",
-            date="2026-02-27",
-            document_context=active_ws.document_context,
-            conversation_history=msgs,
-            active_agents=active_ws.active_agents,
-            workroom=active_ws,
-        )
-        elapsed = time.time() - t0
+        if test["id"] in prefetched:
+            result, elapsed = prefetched[test["id"]].result()
+        else:
+            result, elapsed = _send(orch, test, msgs, common_kwargs)
         total_time += elapsed
 
         agent_label = result.get("agent", "?")
@@ -229,7 +328,7 @@ def run_evaluation() -> dict:
 
         print(f"  \u23f1\ufe0f  Response in {elapsed:.1f}s \u2014 Agent: {agent_label}")
 
-        is_fallback = "I'm not sure what you'd like to do" in text
+        is_fallback = result.get("is_fallback", False)
         if is_fallback:
             fallback_hits += 1
             print(f"  \u274c HIT FALLBACK MENU \u2014 routing failed")
@@ -247,30 +346,28 @@ def run_evaluation() -> dict:
 
         if multi:
             print(f"  \U0001f4ca Round table: {len(multi)} agents responded")
-            for resp in multi:
-                r_text = resp.get('text', '')
-                m = evaluate_response(r_text)
+        for resp in multi or ({"agent": agent_label, "text": text},):
+            r_text = resp.get('text', '')
+            m = evaluate_response(r_text)
+            if VERBOSE:
                 _print_response(resp.get('agent', '?'), r_text, m)
-                m["agent"] = resp.get('agent', '?')
-                q_result["responses"].append(m)
-                all_response_metrics.append(m)
-        else:
-            m = evaluate_response(text)
-            _print_response(agent_label, text, m)
-            m["agent"] = agent_label
+            m["agent"] = resp.get('agent', '?')
             q_result["responses"].append(m)
-            all_response_metrics.append(m)
+            # Tally as we go — the per-response dicts live only in q_result
+            total_responses += 1
+            concise_pass += m["concise"]
+            no_struct_pass += not m["has_structure"]
+            takeaway_pass += m["has_takeaway"]
+            decision_count += m["is_decision"]
 
         question_results.append(q_result)
         msgs.append({"role": "assistant", "content": text, "agent": agent_label})
 
-    # ── Aggregate scores ──────────────────────────────────────────
-    total_responses = len(all_response_metrics)
-    concise_pass = sum(1 for m in all_response_metrics if m["concise"])
-    no_struct_pass = sum(1 for m in all_response_metrics if not m["has_structure"])
-    takeaway_pass = sum(1 for m in all_response_metrics if m["has_takeaway"])
-    decision_count = sum(1 for m in all_response_metrics if m["is_decision"])
+    if pool:
+        pool.shutdown()
+    wall_time = time.perf_counter() - wall_t0
 
+    # ── Aggregate scores ──────────────────────────────────────────
     concise_pct = round(concise_pass / total_responses * 100) if total_responses else 0
     no_struct_pct = round(no_struct_pass / total_responses * 100) if total_responses else 0
     takeaway_pct = round(takeaway_pass / total_responses * 100) if total_responses else 0
@@ -291,6 +388,8 @@ def run_evaluation() -> dict:
         "decision_count": decision_count,
         "total_time_s": round(total_time, 1),
         "avg_time_s": round(total_time / len(TEST_MESSAGES), 1),
+        "wall_time_s": round(wall_time, 1),
+        "parallel": parallel,
     }
 
     # ── Pass / fail against thresholds ────────────────────────────
@@ -304,9 +403,9 @@ def run_evaluation() -> dict:
 
     # ── Print scorecard ───────────────────────────────────────────
     _divider()
-    print("\n" + "=" * 80)
+    print("\n" + _RULE_80)
     print("  EVALUATION SCORECARD")
-    print("=" * 80)
+    print(_RULE_80)
 
     def _status(ok):
         return "\u2705 PASS" if ok else "\u274c FAIL"
@@ -333,10 +432,11 @@ def run_evaluation() -> dict:
     print(f"\n  Performance:")
     print(f"    Total time      : {scorecard['total_time_s']}s")
     print(f"    Avg per question: {scorecard['avg_time_s']}s")
+    print(f"    Wall time       : {scorecard['wall_time_s']}s{' (parallel)' if parallel else ''}")
 
-    print(f"\n  {'=' * 40}")
+    print(f"\n  {_RULE_40}")
     print(f"  OVERALL: {_status(overall_pass)}")
-    print(f"  {'=' * 40}\n")
+    print(f"  {_RULE_40}\n")
 
     # Build result record
     result_record = {
@@ -357,34 +457,99 @@ def run_evaluation() -> dict:
 # Result persistence                                                  #
 # ================================================================== #
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+else:
+    _loads = json.loads
+
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, default=str) + "\n").encode("utf-8")
+
+
 def save_result(record: dict):
-    """Append a result record to the JSON history file."""
-    history = load_history()
-    history.append(record)
-    RESULTS_FILE.write_text(json.dumps(history, indent=2, default=str))
+    """Append a result record to the JSONL history file."""
+    _migrate_legacy_results()
+    with RESULTS_FILE.open("ab") as f:
+        f.write(_dumps_line(record))
     print(f"  Result saved to {RESULTS_FILE.relative_to(TESTS_DIR.parent)}")
 
 
 def load_history() -> list[dict]:
-    """Load past results from the JSON history file."""
-    if RESULTS_FILE.exists():
-        return json.loads(RESULTS_FILE.read_text())
-    return []
+    """Load past results from the JSONL history file."""
+    return list(iter_history())
+
+
+def iter_history():
+    """Yield past result records one line at a time."""
+    _migrate_legacy_results()
+    if not RESULTS_FILE.exists():
+        return
+    with RESULTS_FILE.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def _migrate_legacy_results():
+    """One-time conversion of the old eval_results.json array into JSONL."""
+    if RESULTS_FILE.exists() or not LEGACY_RESULTS_FILE.exists():
+        return
+    history = _loads(LEGACY_RESULTS_FILE.read_bytes())
+    RESULTS_FILE.write_bytes(b"".join(_dumps_line(rec) for rec in history))
+    LEGACY_RESULTS_FILE.unlink()
+
+
+def history_summaries() -> list[dict]:
+    """Return (timestamp, scorecard, overall_pass) per run, cached on file mtime.
+
+    The per-question payloads are dropped, and the result is pickled next to
+    the history file so repeat --history calls skip the JSON parse entirely.
+    """
+    _migrate_legacy_results()
+    try:
+        mtime_ns = RESULTS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    try:
+        with HISTORY_CACHE_FILE.open("rb") as f:
+            cached_mtime, rows = pickle.load(f)
+        if cached_mtime == mtime_ns:
+            return rows
+    except Exception:
+        pass  # missing or unreadable cache: rebuild below
+
+    rows = [
+        {
+            "timestamp": rec.get("timestamp", "?"),
+            "scorecard": rec.get("scorecard", {}),
+            "overall_pass": rec.get("overall_pass"),
+        }
+        for rec in iter_history()
+    ]
+    try:
+        with HISTORY_CACHE_FILE.open("wb") as f:
+            pickle.dump((mtime_ns, rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return rows
 
 
 def print_history():
     """Print a comparison table of all past evaluation runs."""
-    history = load_history()
+    history = history_summaries()
     if not history:
         print("No evaluation history found.")
         return
 
-    print("=" * 96)
+    print(_RULE_96)
     print("  EVALUATION HISTORY")
-    print("=" * 96)
+    print(_RULE_96)
     print(f"\n  {'#':<4} {'Timestamp':<22} {'Route':<8} {'Concise':<10} {'Prose':<10} "
           f"{'Decide':<8} {'Time':<8} {'Result':<8}")
-    print(f"  {'─'*4} {'─'*22} {'─'*8} {'─'*10} {'─'*10} {'─'*8} {'─'*8} {'─'*8}")
+    print(_HISTORY_RULE)
 
     for i, rec in enumerate(history, 1):
         sc = rec.get("scorecard", {})
@@ -411,16 +576,16 @@ def main():
         print_history()
         return
 
-    record = run_evaluation()
+    record = run_evaluation(parallel="--parallel" in sys.argv)
     save_result(record)
 
     # Show comparison with previous run if available
-    history = load_history()
+    history = history_summaries()
     if len(history) >= 2:
         prev = history[-2]["scorecard"]
         curr = history[-1]["scorecard"]
         print("\n  COMPARISON WITH PREVIOUS RUN:")
-        print(f"  {'─' * 50}")
+        print(f"  {_THIN_RULE_50}")
 
         def _delta(key, label, fmt="%", lower_better=False):
             p, c = prev.get(key, 0), curr.get(key, 0)
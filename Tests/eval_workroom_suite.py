@@ -11,48 +11,79 @@ career growth (1).
 Usage:
     cd "PM Agent" && source .venv/bin/activate
     python3 Tests/eval_workroom_suite.py
+    python3 Tests/eval_workroom_suite.py --batch-judge   # judge via one Batch API job
+    python3 Tests/eval_workroom_suite.py --no-cache      # re-judge unchanged transcripts
+    python3 Tests/eval_workroom_suite.py --dry-run       # list topics, no LLM calls
+    python3 Tests/eval_workroom_suite.py --rescore Tests/runs/<run>.json   # rescore a saved run
 """
 
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import math
+import random
 import sys
+import threading
 import re
 import json
 import time
 import textwrap
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import date
+from typing import TYPE_CHECKING
+
+try:  # faster JSON for verdicts, cache files and batch payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 agent_dir = Path(__file__).resolve().parent.parent / "agent-claude"
 sys.path.insert(0, str(agent_dir))
 
-from config import MODEL, make_openai_client
-from storage import StorageManager
-from models.workroom import WorkroomSession
-from agents.orchestrator import Orchestrator
+from config import AZURE_OPENAI_ENDPOINT, CONCISE_MODEL, MODEL, make_openai_client
+
+# The orchestrator, storage and OpenAI SDK are imported where they are first
+# needed, so --dry-run and --help return without loading the agent stack
+if TYPE_CHECKING:
+    from storage import StorageManager
+    from agents.orchestrator import Orchestrator
 
 
 # ── Heuristic metric helpers ─────────────────────────────────────
 
+_MD_STRIP = re.compile(r'\*\*|\*|`|#{1,6}\s')
+_NL = re.compile(r'\n+')
+_SENT_SPLIT = re.compile(r'[.!?]+')
+# A header, bullet or numbered item with content, or a "**Label**:" lead-in,
+# at the start of any (whitespace-trimmed) line
+_FORMAT_RE = re.compile(r'^\s*(?:#{1,6}|[-*]|\d+\.)[^\S\n]+\S|^\s*\*\*[A-Z].*?\*\*:', re.M)
+
+
 def count_sentences(text: str) -> int:
     """Rough sentence count via period/question/exclamation splitting."""
-    clean = re.sub(r'\*\*|\*|`|#{1,6}\s', '', text)
-    clean = re.sub(r'\n+', ' ', clean)
-    sents = re.split(r'[.!?]+', clean)
+    clean = _MD_STRIP.sub('', text)
+    clean = _NL.sub(' ', clean)
+    sents = _SENT_SPLIT.split(clean)
     return len([s for s in sents if s.strip() and len(s.strip()) > 10])
 
 
 def has_structured_formatting(text: str) -> bool:
     """Check if response uses headers, bullets, or numbered lists."""
-    patterns = [
-        r'^#{1,6}\s',
-        r'^\s*[-*]\s',
-        r'^\s*\d+\.\s',
-        r'\*\*[A-Z].*?\*\*:',
-    ]
-    for line in text.split('\n'):
-        for p in patterns:
-            if re.match(p, line.strip()):
-                return True
-    return False
+    return _FORMAT_RE.search(text) is not None
 
 
 def has_takeaway(text: str) -> bool:
@@ -60,23 +91,59 @@ def has_takeaway(text: str) -> bool:
     return '→' in text
 
 
-def print_divider(char='─', width=80):
-    print(char * width)
+def scan_response(text: str) -> tuple[int, bool, bool]:
+    """Return (sentences, has_structure, has_takeaway) for one response."""
+    return count_sentences(text), has_structured_formatting(text), '→' in text
+
+
+# NUL never appears in model output and, unlike \x1e, is not matched by \s
+_RECORD_SEP = '\x00'
+
+
+def scan_responses(texts: list[str]) -> list[tuple[int, bool, bool]]:
+    """scan_response over a whole round table, in order.
+
+    The markdown/newline cleanup runs once over all responses joined by a
+    separator; only the sentence split and the line-anchored structure check
+    stay per response.
+    """
+    clean = _NL.sub(' ', _MD_STRIP.sub('', _RECORD_SEP.join(texts)))
+    return [
+        (
+            sum(1 for s in _SENT_SPLIT.split(segment) if len(s.strip()) > 10),
+            has_structured_formatting(text),
+            '→' in text,
+        )
+        for segment, text in zip(clean.split(_RECORD_SEP), texts)
+    ]
+
+
+# Shared by every response print; wrap() keeps no per-call state on the
+# instance, so concurrent sessions can use it too
+_WRAPPER = textwrap.TextWrapper(
+    width=76, initial_indent='     ', subsequent_indent='     ',
+    break_long_words=False, break_on_hyphens=False,
+)
+
 
+def print_divider(char='─', width=80, out=None):
+    print(char * width, file=out)
 
-def print_response(label: str, text: str, metrics: dict):
+
+def print_response(label: str, text: str, metrics: dict, out=None):
     """Pretty-print an agent response with metrics."""
-    print(f"\n  📎 {label}")
-    wrapped = textwrap.fill(text, width=76, initial_indent='     ', subsequent_indent='     ')
-    print(wrapped[:600])
+    print(f"\n  📎 {label}", file=out)
+    # Only the first 600 chars are shown, so don't wrap the rest
+    wrapped = _WRAPPER.fill(text[:600])
+    print(wrapped[:600], file=out)
     if len(text) > 600:
-        print(f"     ...({len(text)} total chars)")
+        print(f"     ...({len(text)} total chars)", file=out)
 
     sents = metrics['sentences']
     concise_ok = '✅' if sents <= 6 else '❌'
     format_ok = '✅' if not metrics['has_structure'] else '⚠️  structured'
     takeaway_ok = '✅' if metrics['has_takeaway'] else '⚠️  missing →'
-    print(f"     [{concise_ok} {sents} sent | {format_ok} | {takeaway_ok}]")
+    print(f"     [{concise_ok} {sents} sent | {format_ok} | {takeaway_ok}]", file=out)
 
 
 # ── LLM-as-Judge ─────────────────────────────────────────────────
@@ -102,42 +169,313 @@ Return ONLY valid JSON in this exact format (no markdown fences):
 """
 
 
-def llm_judge(topic_label: str, goal: str, conversation: list[dict]) -> dict:
-    """Send full conversation to LLM for rubric-based evaluation."""
+def _strip_fences(raw: str) -> str:
+    """Strip markdown code fences if present."""
+    raw = re.sub(r'^```(?:json)?\s*', '', raw.strip())
+    return re.sub(r'\s*```$', '', raw)
+
+
+def _parse_verdict(raw: str):
+    """Return the judge JSON if *raw* already holds a complete object, else None."""
+    raw = _strip_fences(raw)
+    end = raw.rfind("}")
+    try:
+        return _loads(raw[:end + 1])
+    except ValueError:
+        return None
+
+
+def llm_judge(topic_label: str, goal: str, conversation: list[dict], out=None) -> dict:
+    """Send full conversation to LLM for rubric-based evaluation.
+
+    Judged once per session on purpose: coherence is scored across turns, and
+    one call over the capped transcript is cheaper than a call per turn.
+    """
+    transcript = build_transcript(topic_label, goal, conversation)
+    cached = _cached_verdict(transcript)
+    if cached is not None:
+        return cached
+    if not _JUDGE_BREAKER.allow():
+        print("     ⚠️ Judge skipped: provider circuit open", file=out)
+        return _failed_verdict("judge unavailable (circuit open)")
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
     client = make_openai_client()
 
-    # Build conversation transcript
-    lines = [f"TOPIC: {topic_label}", f"GOAL: {goal}", "", "CONVERSATION:"]
+    # The SDK already retries failed requests; this loop also covers streams
+    # that drop mid-response, with full-jitter exponential backoff.
+    for attempt in range(JUDGE_ATTEMPTS):
+        try:
+            verdict = _stream_verdict(client, transcript)
+        except (RateLimitError, APITimeoutError, APIConnectionError) as exc:
+            error = exc
+            if attempt + 1 < JUDGE_ATTEMPTS:
+                time.sleep(random.uniform(0, min(30, 2 ** (attempt + 1))))
+                continue
+            _JUDGE_BREAKER.record(ok=False)
+        except Exception as exc:
+            error = exc
+            if isinstance(exc, APIError):
+                _JUDGE_BREAKER.record(ok=False)
+        else:
+            _JUDGE_BREAKER.record(ok=True)
+            _store_verdict(transcript, verdict)
+            return verdict
+        break
+    print(f"     ⚠️ Judge error: {error}", file=out)
+    return _failed_verdict(error)
+
+
+def _stream_verdict(client, transcript: str) -> dict:
+    stream = client.chat.completions.create(
+        **_judge_request(transcript),
+        stream=True,
+    )
+    # Stop reading as soon as the verdict object parses — anything the
+    # model appends after it (closing fences, commentary) is not waited for
+    parts: list[str] = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content or ""
+        parts.append(delta)
+        if "}" in delta:
+            verdict = _parse_verdict("".join(parts))
+            if verdict is not None:
+                stream.close()
+                return verdict
+    return _loads(_strip_fences("".join(parts)))
+
+
+class _CircuitBreaker:
+    """Stops calling a provider after repeated failures, retrying after a pause."""
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            return time.monotonic() - self._opened_at >= self.recovery_timeout
+
+    def record(self, ok: bool):
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._opened_at = time.monotonic()
+
+
+JUDGE_ATTEMPTS = 3
+_JUDGE_BREAKER = _CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+
+JUDGE_TRANSCRIPT_TOKENS = 3000  # judge input budget for the conversation
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoder():
+    """tiktoken encoder for MODEL, or None when tiktoken isn't installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _count_tokens(text: str) -> int:
+    enc = _token_encoder()
+    return len(enc.encode(text)) if enc else len(text) // 4 + 1  # ~4 chars/token
+
+
+def _clip_tokens(text: str, max_tokens: int) -> str:
+    enc = _token_encoder()
+    if enc is None:
+        return text[:max_tokens * 4]
+    return enc.decode(enc.encode(text)[:max_tokens])
+
+
+def build_transcript(topic_label: str, goal: str, conversation: list[dict]) -> str:
+    """Render a session as the judge's user message, within the token budget.
+
+    The first and last messages are always kept; the rest of the budget is
+    filled newest-first, and any dropped middle stretch is marked.
+    """
+    header = "\n".join([f"TOPIC: {topic_label}", f"GOAL: {goal}", "", "CONVERSATION:"])
+    lines = []
     for msg in conversation:
         role = msg.get("role", "?")
         agent = msg.get("agent", "")
-        content = msg.get("content", "")[:500]  # Truncate for cost
         prefix = f"[{agent}]" if agent else f"[{role}]"
-        lines.append(f"{prefix}: {content}")
+        lines.append(f"{prefix}: {msg.get('content', '')}")
+    if not lines:
+        return header
+
+    costs = [_count_tokens(line) for line in lines]
+    # The pinned first/last messages are clipped to pinned_max, so that
+    # (not their full size) is what they take from the budget
+    pinned_max = JUDGE_TRANSCRIPT_TOKENS // 2
+    pinned = {0, len(lines) - 1}
+    keep = set(pinned)
+    budget = JUDGE_TRANSCRIPT_TOKENS - sum(min(costs[i], pinned_max) for i in pinned)
+    for i in range(len(lines) - 2, 0, -1):
+        if costs[i] > budget:
+            break
+        keep.add(i)
+        budget -= costs[i]
+
+    dropped = len(lines) - len(keep)
+    out = [header]
+    for i, line in enumerate(lines):
+        if i in pinned and costs[i] > pinned_max:
+            out.append(_clip_tokens(line, pinned_max))
+        elif i in keep:
+            out.append(line)
+        elif i == 1:
+            out.append(f"[... {dropped} earlier messages omitted ...]")
+    return "\n".join(out)
+
+
+def _judge_request(transcript: str) -> dict:
+    """Chat-completions body for one judge call (shared with the batch path)."""
+    return {
+        "model": MODEL,
+        "max_tokens": 300,
+        "messages": [
+            {"role": "system", "content": JUDGE_SYSTEM},
+            {"role": "user", "content": transcript},
+        ],
+    }
+
+
+# ── Judge verdict cache ──────────────────────────────────────────
+# Keyed on SHA-256 of (model, rubric, transcript): an unchanged session is
+# never re-judged. Failed verdicts are not cached. Disable with --no-cache.
+
+JUDGE_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "judge"
+USE_JUDGE_CACHE = True  # --no-cache
+
+
+def _verdict_path(transcript: str) -> Path:
+    key = hashlib.sha256(
+        # stdlib json on purpose: keys must not depend on whether orjson is installed
+        json.dumps([MODEL, JUDGE_SYSTEM, transcript]).encode("utf-8")
+    ).hexdigest()
+    return JUDGE_CACHE_DIR / f"{key}.json"
 
-    transcript = "\n".join(lines)
 
+def _cached_verdict(transcript: str):
+    if not USE_JUDGE_CACHE:
+        return None
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            max_tokens=300,
-            messages=[
-                {"role": "system", "content": JUDGE_SYSTEM},
-                {"role": "user", "content": transcript},
-            ],
+        return _loads(_verdict_path(transcript).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_verdict(transcript: str, verdict: dict):
+    if not USE_JUDGE_CACHE:
+        return
+    try:
+        JUDGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _verdict_path(transcript).write_bytes(_dumps(verdict))
+    except OSError:
+        pass
+
+
+def _failed_verdict(exc) -> dict:
+    return {
+        "relevance": 0, "differentiation": 0, "actionability": 0,
+        "coherence": 0, "conciseness": 0,
+        "rationale": f"Judge failed: {exc}",
+    }
+
+
+# ── Batch judge (--batch-judge) ──────────────────────────────────
+
+JUDGE_BATCH_POLL_S = 30
+
+
+class BatchJudge:
+    """Collects judge requests and submits them as one Batch API job.
+
+    Drop-in for the judge pool passed to run_session(): submit() returns a
+    Future that flush() resolves once the batch completes. Batch jobs are
+    billed at a discount but may take minutes to hours, so this is opt-in.
+    """
+
+    def __init__(self):
+        self._pending: list[tuple[str, Future]] = []
+
+    def submit(self, fn, topic_label: str, goal: str, conversation: list[dict]) -> Future:
+        fut: Future = Future()
+        transcript = build_transcript(topic_label, goal, conversation)
+        cached = _cached_verdict(transcript)
+        if cached is not None:
+            fut.set_result(cached)
+        else:
+            self._pending.append((transcript, fut))
+        return fut
+
+    def flush(self):
+        """Run the batch and resolve every pending future (failures included)."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            verdicts = self._run_batch([t for t, _ in pending])
+        except Exception as exc:
+            print(f"     ⚠️ Batch judge error: {exc}")
+            for _, fut in pending:
+                fut.set_result(_failed_verdict(exc))
+            return
+        for i, (_, fut) in enumerate(pending):
+            fut.set_result(verdicts.get(str(i)) or _failed_verdict("missing from batch output"))
+
+    @staticmethod
+    def _run_batch(transcripts: list[str]) -> dict[str, dict]:
+        client = make_openai_client()
+        # Azure batch deployments take the path without the /v1 prefix
+        url = "/chat/completions" if AZURE_OPENAI_ENDPOINT else "/v1/chat/completions"
+        payload = b"".join(
+            _dumps({"custom_id": str(i), "method": "POST", "url": url,
+                    "body": _judge_request(t)}) + b"\n"
+            for i, t in enumerate(transcripts)
         )
-        raw = response.choices[0].message.content.strip()
-        # Strip markdown code fences if present
-        raw = re.sub(r'^```(?:json)?\s*', '', raw)
-        raw = re.sub(r'\s*```$', '', raw)
-        return json.loads(raw)
-    except Exception as exc:
-        print(f"     ⚠️ Judge error: {exc}")
-        return {
-            "relevance": 0, "differentiation": 0, "actionability": 0,
-            "coherence": 0, "conciseness": 0,
-            "rationale": f"Judge failed: {exc}",
-        }
+        batch_file = client.files.create(file=("judge_batch.jsonl", payload), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id, endpoint=url, completion_window="24h",
+        )
+        print(f"\n  ⏳ Judge batch {batch.id} submitted ({len(transcripts)} requests)")
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(JUDGE_BATCH_POLL_S)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+        verdicts: dict[str, dict] = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            rec = _loads(line)
+            try:
+                raw = rec["response"]["body"]["choices"][0]["message"]["content"]
+                verdict = _loads(_strip_fences(raw))
+                _store_verdict(transcripts[int(rec["custom_id"])], verdict)
+                verdicts[rec["custom_id"]] = verdict
+            except (KeyError, IndexError, TypeError, ValueError) as exc:
+                verdicts[rec["custom_id"]] = _failed_verdict(exc)
+        return verdicts
 
 
 # ── Evaluation Topics ────────────────────────────────────────────
@@ -352,17 +690,26 @@ EVAL_TOPICS = [
 
 # ── Session Runner ────────────────────────────────────────────────
 
-def run_session(topic: dict, storage: StorageManager, orch: Orchestrator) -> dict:
+def run_session(
+    topic: dict, storage: StorageManager, orch: Orchestrator, out=None, judge_pool=None,
+) -> dict:
     """
     Run a single evaluation topic: create workroom, execute turns,
     collect metrics, run LLM judge.
 
+    Progress is printed to *out* (stdout by default) so concurrent sessions
+    can each write to their own buffer. With a *judge_pool*, the judge call is
+    submitted there and returned as 'judge_future' instead of awaited; pass
+    the result through apply_judge() once it is done.
+
     Returns a dict with per-turn metrics and judge scores.
     """
-    print_divider('━')
-    print(f"\n  🧪 {topic['label']}")
-    print(f"  🎯 Goal: {topic['goal'][:100]}...")
-    print(f"  👥 Agents: {', '.join(topic['agents'])}")
+    print_divider('━', out=out)
+    print(f"\n  🧪 {topic['label']}", file=out)
+    print(f"  🎯 Goal: {topic['goal'][:100]}...", file=out)
+    print(f"  👥 Agents: {', '.join(topic['agents'])}", file=out)
+
+    from models.workroom import WorkroomSession
 
     # Create ephemeral workroom (not persisted to storage)
     ws = WorkroomSession(
@@ -382,8 +729,8 @@ def run_session(topic: dict, storage: StorageManager, orch: Orchestrator) -> dic
     session_start = time.time()
 
     for i, turn in enumerate(topic['turns']):
-        print(f"\n  ── {turn['label']} ──")
-        print(f"  📤 \"{turn['message'][:90]}{'...' if len(turn['message']) > 90 else ''}\"")
+        print(f"\n  ── {turn['label']} ──", file=out)
+        print(f"  📤 \"{turn['message'][:90]}{'...' if len(turn['message']) > 90 else ''}\"", file=out)
 
         msgs.append({"role": "user", "content": turn['message']})
 
@@ -404,41 +751,41 @@ def run_session(topic: dict, storage: StorageManager, orch: Orchestrator) -> dic
         text = result.get("text", "")
         multi = result.get("multi_response") or []
 
-        print(f"  ⏱️  {elapsed:.1f}s — {agent_label}")
+        print(f"  ⏱️  {elapsed:.1f}s — {agent_label}", file=out)
 
-        # Check fallback
-        is_fallback = "I'm not sure what you'd like to do" in text
+        is_fallback = result.get("is_fallback", False)
 
         # Collect per-response metrics
         responses = []
         if multi:
-            print(f"  📊 Round table: {len(multi)} agent(s)")
-            for resp in multi:
-                r_text = resp.get('text', '')
+            print(f"  📊 Round table: {len(multi)} agent(s)", file=out)
+            r_texts = [resp.get('text', '') for resp in multi]
+            for resp, r_text, (sents, structured, takeaway) in zip(multi, r_texts, scan_responses(r_texts)):
                 m = {
                     'agent': resp.get('agent', '?'),
-                    'sentences': count_sentences(r_text),
-                    'has_structure': has_structured_formatting(r_text),
-                    'has_takeaway': has_takeaway(r_text),
+                    'sentences': sents,
+                    'has_structure': structured,
+                    'has_takeaway': takeaway,
                     'is_fallback': False,
                     'char_count': len(r_text),
                 }
                 responses.append(m)
-                print_response(m['agent'], r_text, m)
+                print_response(m['agent'], r_text, m, out=out)
         else:
+            sents, structured, takeaway = scan_response(text)
             m = {
                 'agent': agent_label,
-                'sentences': count_sentences(text),
-                'has_structure': has_structured_formatting(text),
-                'has_takeaway': has_takeaway(text),
+                'sentences': sents,
+                'has_structure': structured,
+                'has_takeaway': takeaway,
                 'is_fallback': is_fallback,
                 'char_count': len(text),
             }
             responses.append(m)
             if is_fallback:
-                print(f"  ❌ FALLBACK MENU HIT")
+                print(f"  ❌ FALLBACK MENU HIT", file=out)
             else:
-                print_response(agent_label, text, m)
+                print_response(agent_label, text, m, out=out)
 
         turn_metrics.append({
             'turn': turn['label'],
@@ -448,53 +795,61 @@ def run_session(topic: dict, storage: StorageManager, orch: Orchestrator) -> dic
 
         # Add to conversation history
         msgs.append({"role": "assistant", "content": text, "agent": agent_label})
-        if multi:
-            for resp in multi:
-                msgs.append({
-                    "role": "assistant",
-                    "content": resp.get('text', ''),
-                    "agent": resp.get('agent', ''),
-                })
+        msgs.extend(
+            {"role": "assistant", "content": resp.get('text', ''), "agent": resp.get('agent', '')}
+            for resp in multi
+        )
 
     session_elapsed = time.time() - session_start
 
-    # ── LLM Judge ──
-    print(f"\n  🤖 Running LLM judge...")
-    judge_scores = llm_judge(topic['label'], topic['goal'], msgs)
-    rationale = judge_scores.pop('rationale', '')
-    print(f"     Scores: {judge_scores}")
-    if rationale:
-        print(f"     Rationale: {rationale}")
-
-    return {
+    result = {
         'topic': topic['label'],
         'agents': topic['agents'],
         'turn_metrics': turn_metrics,
-        'judge_scores': judge_scores,
-        'judge_rationale': rationale,
+        'judge_scores': {},
+        'judge_rationale': '',
         'session_elapsed': session_elapsed,
     }
 
+    # ── LLM Judge ──
+    if judge_pool is not None:
+        # The verdict only feeds the scorecard — don't hold the session for it
+        result['judge_future'] = judge_pool.submit(llm_judge, topic['label'], topic['goal'], msgs)
+        return result
+    print(f"\n  🤖 Running LLM judge...", file=out)
+    apply_judge(result, llm_judge(topic['label'], topic['goal'], msgs, out=out), out=out)
+    return result
+
+
+def apply_judge(result: dict, judge_scores: dict, out=None):
+    """Record a judge verdict on a session result and print it."""
+    rationale = judge_scores.pop('rationale', '')
+    result['judge_scores'] = judge_scores
+    result['judge_rationale'] = rationale
+    print(f"     Scores: {judge_scores}", file=out)
+    if rationale:
+        print(f"     Rationale: {rationale}", file=out)
+
 
 # ── Scorecard ─────────────────────────────────────────────────────
 
 def compute_session_score(result: dict) -> dict:
     """Compute heuristic pass rates and combined score for a session."""
-    all_responses = []
+    total = concise_pass = prose_pass = takeaway_pass = fallback_count = 0
     for tm in result['turn_metrics']:
-        all_responses.extend(tm['responses'])
-
-    total = len(all_responses) or 1
-    concise_pass = sum(1 for r in all_responses if r['sentences'] <= 6)
-    prose_pass = sum(1 for r in all_responses if not r['has_structure'])
-    takeaway_pass = sum(1 for r in all_responses if r['has_takeaway'])
-    fallback_count = sum(1 for r in all_responses if r.get('is_fallback'))
+        for r in tm['responses']:
+            total += 1
+            concise_pass += r['sentences'] <= 6
+            prose_pass += not r['has_structure']
+            takeaway_pass += r['has_takeaway']
+            fallback_count += bool(r.get('is_fallback'))
+    total = total or 1
 
     heuristic_rate = (concise_pass + prose_pass + takeaway_pass) / (total * 3)
 
     judge = result['judge_scores']
     judge_vals = [v for v in judge.values() if isinstance(v, (int, float))]
-    judge_avg = sum(judge_vals) / len(judge_vals) if judge_vals else 0
+    judge_avg = math.fsum(judge_vals) / len(judge_vals) if judge_vals else 0
 
     # session_score = heuristic_pass_rate * 50 + judge_avg * 10  → scale 0-100
     session_score = (heuristic_rate * 50) + (judge_avg * 10)
@@ -511,16 +866,67 @@ def compute_session_score(result: dict) -> dict:
     }
 
 
+JUDGE_DIMS = ('relevance', 'differentiation', 'actionability', 'coherence', 'conciseness')
+
+
+class ScorecardAggregate:
+    """Suite-wide totals, folded in one session at a time."""
+
+    def __init__(self):
+        self.topics = 0
+        self.total = 0
+        self.concise = 0
+        self.prose = 0
+        self.takeaway = 0
+        self.fallback = 0
+        self.elapsed = 0.0
+        self.session_scores: list[float] = []
+        self.judge_vals: dict[str, list[float]] = {dim: [] for dim in JUDGE_DIMS}
+
+    def add(self, result: dict, sc: dict):
+        self.topics += 1
+        self.total += sc['total_responses']
+        self.concise += sc['concise_pass']
+        self.prose += sc['prose_pass']
+        self.takeaway += sc['takeaway_pass']
+        self.fallback += sc['fallback_count']
+        self.elapsed += result['session_elapsed']
+        self.session_scores.append(sc['session_score'])
+        judge = result['judge_scores']
+        for dim, vals in self.judge_vals.items():
+            v = judge.get(dim)
+            if isinstance(v, (int, float)):
+                vals.append(v)
+
+    @property
+    def avg_score(self) -> float:
+        return math.fsum(self.session_scores) / len(self.session_scores) if self.session_scores else 0
+
+    def judge_avg(self, dim: str) -> float:
+        vals = self.judge_vals[dim]
+        return math.fsum(vals) / len(vals) if vals else 0
+
+
 def print_scorecard(results: list[dict]):
-    """Print the final aggregate scorecard."""
+    """Print the final aggregate scorecard with a single stdout write."""
+    buf = io.StringIO()
+    # Runs after every session and judge thread has finished, so capturing
+    # stdout here cannot swallow anyone else's output
+    with contextlib.redirect_stdout(buf):
+        _print_scorecard(results)
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
+def _print_scorecard(results: list[dict]):
     print("\n" + "=" * 80)
     print("  EVALUATION SCORECARD")
     print("=" * 80)
 
-    all_scores = []
+    agg = ScorecardAggregate()
     for result in results:
         sc = compute_session_score(result)
-        all_scores.append(sc)
+        agg.add(result, sc)
 
         print(f"\n  📋 {result['topic']}")
         print(f"     Agents: {', '.join(result['agents'])}")
@@ -545,67 +951,149 @@ def print_scorecard(results: list[dict]):
     # Aggregate
     print_divider('━')
     print("\n  📊 AGGREGATE")
-    total_resp = sum(s['total_responses'] for s in all_scores)
-    total_concise = sum(s['concise_pass'] for s in all_scores)
-    total_prose = sum(s['prose_pass'] for s in all_scores)
-    total_takeaway = sum(s['takeaway_pass'] for s in all_scores)
-    total_fallback = sum(s['fallback_count'] for s in all_scores)
-    avg_score = sum(s['session_score'] for s in all_scores) / len(all_scores)
-
-    print(f"     Topics evaluated:   {len(results)}")
+    total_resp = agg.total
+    avg_score = agg.avg_score
+
+    print(f"     Topics evaluated:   {agg.topics}")
     print(f"     Total responses:    {total_resp}")
-    print(f"     Concise pass rate:  {total_concise}/{total_resp} ({total_concise/total_resp*100:.0f}%)")
-    print(f"     Prose pass rate:    {total_prose}/{total_resp} ({total_prose/total_resp*100:.0f}%)")
-    print(f"     Takeaway pass rate: {total_takeaway}/{total_resp} ({total_takeaway/total_resp*100:.0f}%)")
-    print(f"     Fallback hits:      {total_fallback}")
+    print(f"     Concise pass rate:  {agg.concise}/{total_resp} ({agg.concise/total_resp*100:.0f}%)")
+    print(f"     Prose pass rate:    {agg.prose}/{total_resp} ({agg.prose/total_resp*100:.0f}%)")
+    print(f"     Takeaway pass rate: {agg.takeaway}/{total_resp} ({agg.takeaway/total_resp*100:.0f}%)")
+    print(f"     Fallback hits:      {agg.fallback}")
     print(f"     Average score:      {avg_score:.1f}/100")
 
     # Judge averages
-    dims = ['relevance', 'differentiation', 'actionability', 'coherence', 'conciseness']
     print(f"\n     LLM Judge Averages:")
-    for dim in dims:
-        vals = [r['judge_scores'].get(dim, 0) for r in results if isinstance(r['judge_scores'].get(dim), (int, float))]
-        avg = sum(vals) / len(vals) if vals else 0
-        print(f"       {dim:20s}: {avg:.1f}/5")
+    for dim in JUDGE_DIMS:
+        print(f"       {dim:20s}: {agg.judge_avg(dim):.1f}/5")
 
-    total_time = sum(r['session_elapsed'] for r in results)
+    total_time = agg.elapsed
     print(f"\n     Total eval time:    {total_time:.0f}s ({total_time/60:.1f}min)")
     print(f"\n     {'✅ PASS' if avg_score >= 70 else '❌ NEEDS IMPROVEMENT'} (target: ≥70/100)")
     print("=" * 80)
 
 
+# ── Saved runs ────────────────────────────────────────────────────
+
+# Raw per-session results from each run, so scoring changes can be
+# re-applied with --rescore without paying for the sessions again
+RUNS_DIR = Path(__file__).resolve().parent / "runs"
+
+
+def save_run(results: list[dict]) -> Path:
+    """Write *results* to Tests/runs/<timestamp>.json and return the path."""
+    RUNS_DIR.mkdir(exist_ok=True)
+    path = RUNS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    path.write_bytes(_dumps(results))
+    return path
+
+
+def load_run(path: Path) -> list[dict]:
+    return _loads(Path(path).read_bytes())
+
+
 # ── Main ──────────────────────────────────────────────────────────
 
+MAX_CONCURRENT_TOPICS = 5
+
+
+def _run_topic(topic: dict, storage: StorageManager, orch: Orchestrator, judge_pool) -> tuple[dict, str]:
+    """Run one session into a private buffer; return (result, captured output)."""
+    out = io.StringIO()
+    try:
+        result = run_session(topic, storage, orch, out=out, judge_pool=judge_pool)
+    except Exception as exc:
+        print(f"\n  ❌ TOPIC FAILED: {topic['label']}", file=out)
+        print(f"     Error: {exc}", file=out)
+        import traceback
+        traceback.print_exc(file=out)
+        result = {
+            'topic': topic['label'],
+            'agents': topic['agents'],
+            'turn_metrics': [],
+            'judge_scores': {},
+            'judge_rationale': f'Session failed: {exc}',
+            'session_elapsed': 0,
+        }
+    return result, out.getvalue()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the multi-topic workroom evaluation suite.")
+    parser.add_argument("--batch-judge", action="store_true",
+                        help="collect judge calls into one Batch API job")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-judge transcripts even if a cached verdict exists")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="list the topics and exit without calling any model")
+    parser.add_argument("--rescore", metavar="PATH", type=Path,
+                        help="print the scorecard for a saved run instead of running the suite")
+    return parser.parse_args(argv)
+
+
+def print_topics():
+    for topic in EVAL_TOPICS:
+        print(f"  {topic['label']}")
+        print(f"     Agents: {', '.join(topic['agents'])}")
+        print(f"     Turns:  {len(topic['turns'])}")
+
+
 def main():
+    global USE_JUDGE_CACHE
+    args = parse_args()
+    if args.dry_run:
+        print_topics()
+        return
+    if args.rescore:
+        print_scorecard(load_run(args.rescore))
+        return
+    USE_JUDGE_CACHE = not args.no_cache
+
+    from storage import StorageManager
+    from agents.orchestrator import Orchestrator
+
     print("=" * 80)
     print("  WORKROOM EVALUATION SUITE — 5 Topics × 4 Turns")
     print("=" * 80)
     print(f"  Date: {date.today()}")
     print(f"  Model: {MODEL}")
+    print(f"  Concise model: {CONCISE_MODEL}")
 
     storage = StorageManager()
     orch = Orchestrator(storage)
 
-    results = []
-    for topic in EVAL_TOPICS:
-        try:
-            result = run_session(topic, storage, orch)
+    # Topics are independent (turns within a topic stay sequential), so the
+    # sessions run side by side; each buffers its output, printed in order.
+    # Judge calls go to their own pool so they overlap the remaining sessions,
+    # or are collected into one Batch API job with --batch-judge.
+    batch_judge = BatchJudge() if args.batch_judge else None
+    suite_start = time.time()
+    with ThreadPoolExecutor(max_workers=len(EVAL_TOPICS)) as judge_threads, \
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TOPICS) as pool:
+        judge_pool = batch_judge or judge_threads
+        futures = [pool.submit(_run_topic, topic, storage, orch, judge_pool) for topic in EVAL_TOPICS]
+        results = []
+        for fut in futures:
+            result, output = fut.result()
+            sys.stdout.write(output)
+            sys.stdout.flush()
             results.append(result)
-        except Exception as exc:
-            print(f"\n  ❌ TOPIC FAILED: {topic['label']}")
-            print(f"     Error: {exc}")
-            import traceback
-            traceback.print_exc()
-            results.append({
-                'topic': topic['label'],
-                'agents': topic['agents'],
-                'turn_metrics': [],
-                'judge_scores': {},
-                'judge_rationale': f'Session failed: {exc}',
-                'session_elapsed': 0,
-            })
+
+        if batch_judge:
+            batch_judge.flush()
+        verdicts = io.StringIO()
+        print_divider('━', out=verdicts)
+        print(f"\n  🤖 LLM judge verdicts", file=verdicts)
+        for result in results:
+            judge_future = result.pop('judge_future', None)
+            if judge_future is not None:
+                print(f"\n  {result['topic']}", file=verdicts)
+                apply_judge(result, judge_future.result(), out=verdicts)
+        sys.stdout.write(verdicts.getvalue())
+    print(f"\n  Suite wall time: {time.time() - suite_start:.0f}s")
 
     print_scorecard(results)
+    print(f"\n  Results saved: {save_run(results)}")
 
 
 if __name__ == "__main__":
@@ -5,11 +5,18 @@ Usage:
     cd "PM Agent" && python3 Tests/test_agent_designer.py
 """
 
+import re
 import sys
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:  # faster JSON for the results file
+    import orjson
+except ImportError:
+    orjson = None
+
 agent_dir = Path(__file__).resolve().parent.parent / "agent-claude"
 sys.path.insert(0, str(agent_dir))
 
@@ -67,8 +74,15 @@ TEST_CASES = [
     },
 ]
 
+# Design calls in flight at once — the cases are independent, so they run
+# side by side and wall time tracks the slowest call rather than the sum
+MAX_CONCURRENT_DESIGNS = 5
+
 # ── Helpers ───────────────────────────────────────────────────────
 
+# Letters/digits/underscores with at least one letter or digit
+_SNAKE_CASE_RE = re.compile(r"_*[^\W_]\w*")
+
 PASS = "\033[92mPASS\033[0m"
 FAIL = "\033[91mFAIL\033[0m"
 SKIP = "\033[93mSKIP\033[0m"
@@ -80,13 +94,22 @@ def validate_agent(agent: dict) -> list[str]:
     for field in ("key", "label", "emoji", "description", "system_prompt", "category"):
         if not agent.get(field):
             issues.append(f"missing '{field}'")
-    if agent.get("key") and not agent["key"].replace("_", "").isalnum():
+    if agent.get("key") and not _SNAKE_CASE_RE.fullmatch(agent["key"]):
         issues.append(f"key '{agent['key']}' is not valid snake_case")
     if agent.get("system_prompt") and len(agent["system_prompt"]) < 50:
         issues.append("system_prompt too short (<50 chars)")
     return issues
 
 
+def run_case(designer: AgentDesigner, tc: dict) -> tuple[dict | None, Exception | None, float]:
+    """Design one test case; return (result, exception, elapsed seconds)."""
+    t0 = time.time()
+    try:
+        return designer.design(tc["topic"]), None, time.time() - t0
+    except Exception as exc:
+        return None, exc, time.time() - t0
+
+
 # ── Main ──────────────────────────────────────────────────────────
 
 def main():
@@ -102,27 +125,27 @@ def main():
         print(f"{FAIL}  No API key configured — cannot run tests.")
         sys.exit(1)
 
-    designer = AgentDesigner()
+    designer = AgentDesigner(use_cache=False)  # exercise the model, not cached designs
     results = []
     passed = 0
     failed = 0
 
-    for tc in TEST_CASES:
+    suite_start = time.time()
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DESIGNS) as pool:
+        outcomes = list(pool.map(lambda tc: run_case(designer, tc), TEST_CASES))
+    suite_elapsed = time.time() - suite_start
+
+    for tc, (result, error, elapsed) in zip(TEST_CASES, outcomes):
         tid = tc["id"]
         print(f"── {tid} ──")
         print(f"   Topic: {tc['topic'][:80]}...")
 
-        t0 = time.time()
-        try:
-            result = designer.design(tc["topic"])
-        except Exception as exc:
-            elapsed = time.time() - t0
-            print(f"   {FAIL}  Exception after {elapsed:.1f}s: {exc}")
-            results.append({"id": tid, "status": "FAIL", "error": str(exc)})
+        if error is not None:
+            print(f"   {FAIL}  Exception after {elapsed:.1f}s: {error}")
+            results.append({"id": tid, "status": "FAIL", "error": str(error)})
             failed += 1
             continue
 
-        elapsed = time.time() - t0
         agents = result.get("agents", [])
         reasoning = result.get("reasoning", "")
 
@@ -155,10 +178,16 @@ def main():
             failed += 1
             continue
 
-        # Check: unique keys
-        keys = [a["key"] for a in agents]
-        if len(keys) != len(set(keys)):
-            print(f"   {FAIL}  Duplicate keys: {keys}")
+        # Check: unique keys (single pass, stops at the first repeat)
+        seen_keys = set()
+        duplicate = None
+        for a in agents:
+            if a["key"] in seen_keys:
+                duplicate = a["key"]
+                break
+            seen_keys.add(a["key"])
+        if duplicate is not None:
+            print(f"   {FAIL}  Duplicate key '{duplicate}': {[a['key'] for a in agents]}")
             results.append({"id": tid, "status": "FAIL", "error": "duplicate keys"})
             failed += 1
             continue
@@ -180,14 +209,17 @@ def main():
     # ── Summary ───────────────────────────────────────────────────
     print("=" * 70)
     total = passed + failed
-    print(f"Results: {passed}/{total} passed, {failed}/{total} failed")
+    print(f"Results: {passed}/{total} passed, {failed}/{total} failed  [{suite_elapsed:.1f}s wall]")
     if failed:
         print(f"\nFailed tests: {', '.join(r['id'] for r in results if r['status'] == 'FAIL')}")
     print("=" * 70)
 
     # Write machine-readable results
     out_path = Path(__file__).parent / "eval_agent_designer.json"
-    out_path.write_text(json.dumps(results, indent=2))
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        out_path.write_text(json.dumps(results, indent=2))
     print(f"\nResults written to {out_path}")
 
     sys.exit(1 if failed else 0)
@@ -1,5 +1,6 @@
 """Quick connectivity test — run from project root with the venv active."""
 import sys, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agent-claude"))
 
@@ -14,14 +15,22 @@ print(f"API key:  {'set (' + str(len(_active_key)) + ' chars)' if _active_key el
 client = make_openai_client()
 print(f"Client:   {type(client).__name__}\n")
 
-for i in range(3):
+
+def _ping(i: int) -> str:
     t0 = time.time()
     try:
         resp = client.chat.completions.create(
             model=MODEL, messages=[{"role": "user", "content": "hi"}], max_tokens=5
         )
-        print(f"  Call {i+1}: OK  ({time.time()-t0:.1f}s) — {resp.choices[0].message.content}")
+        return f"  Call {i+1}: OK  ({time.time()-t0:.1f}s) — {resp.choices[0].message.content}"
     except Exception as e:
-        print(f"  Call {i+1}: FAIL ({time.time()-t0:.1f}s) — {type(e).__name__}: {e}")
+        return f"  Call {i+1}: FAIL ({time.time()-t0:.1f}s) — {type(e).__name__}: {e}"
+
+
+# The calls are independent, so fire them together: wall time ≈ slowest call
+t_all = time.time()
+with ThreadPoolExecutor(max_workers=3) as pool:
+    for line in pool.map(_ping, range(3)):
+        print(line)
 
-print("\nDone.")
+print(f"\nDone in {time.time()-t_all:.1f}s.")
@@ -1,5 +1,17 @@
-from .orchestrator import Orchestrator
+import importlib
 
-__all__ = [
-    "Orchestrator",
-]
+# Resolved on first access (PEP 562), so importing a light submodule such as
+# agents.agent_designer doesn't pull in the orchestrator and everything it imports
+_LAZY = {
+    "Orchestrator": "orchestrator",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,197 @@
+"""
+Exact-match response cache for deterministic LLM calls.
+
+Entries are keyed on a sha256 of everything that determines the completion —
+model, system prompt, user message and token limit — so a changed prompt or
+deployment never serves a stale answer. A small in-process LRU sits in front
+of JSON files under ~/.cache/pm-agent/<namespace>/, which survive restarts.
+Both layers hold the serialised JSON, so every hit returns a fresh dict that
+callers are free to mutate.
+
+The model still samples, so the guarantee is only that the same inputs reuse
+the first sampled answer; use it where one good answer is as good as any
+other (TopicClassifier's JSON). Entries never expire unless a *ttl* is
+passed, and the classifier passes none. Creative calls such as AgentDesigner
+use SemanticCache instead, which reuses a result only for a near-duplicate
+query.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+try:  # C-accelerated JSON; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ROOT = Path.home() / ".cache" / "pm-agent"
+
+
+def _dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class LLMCache:
+    def __init__(self, namespace: str, max_memory_entries: int = 256, ttl: Optional[float] = None):
+        self.cache_dir = LLM_CACHE_ROOT / namespace
+        self.max_memory_entries = max_memory_entries
+        self.ttl = ttl  # seconds; None = entries never expire
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, system: str, user: str, max_tokens: Optional[int]) -> str:
+        payload = json.dumps(
+            {"model": model, "system": system, "user": user, "max_tokens": max_tokens},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached result for *key*, or None on a miss or expiry."""
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                if not self._expired(hit[0]):
+                    self._memory.move_to_end(key)
+                    return _loads(hit[1])
+                del self._memory[key]
+
+        path = self.cache_dir / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if self._expired(stored_at):
+                return None
+            raw = path.read_text(encoding="utf-8")
+            value = _loads(raw)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, stored_at, raw)
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        """Store *value*; a disk failure is logged and never raised."""
+        raw = _dumps(value)
+        self._remember(key, time.time(), raw)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError as exc:
+            logger.warning("LLM cache write failed (%s): %s", self.cache_dir.name, exc)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _remember(self, key: str, stored_at: float, raw: str) -> None:
+        with self._lock:
+            self._memory[key] = (stored_at, raw)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+
+class SemanticCache:
+    """Reuse a prior result when a new query's embedding is close to a stored one.
+
+    Vectors are kept unit-normalised in one float32 matrix, so a lookup is a
+    single matrix-vector product. Least recently used entries are evicted past
+    *max_entries*; the cache persists as vectors.npy + values.json.
+    """
+
+    def __init__(self, namespace: str, max_entries: int = 512):
+        self.cache_dir = LLM_CACHE_ROOT / namespace
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._values: list[str] = []
+        self._loaded = False
+
+    def lookup(self, embedding: list[float], threshold: float) -> Optional[dict]:
+        """Return the closest stored result with cosine similarity >= *threshold*."""
+        q = _unit(embedding)
+        with self._lock:
+            self._load()
+            if q is None or self._vectors is None or not self._values:
+                return None
+            if self._vectors.shape[1] != q.shape[0]:
+                return None  # embedding model changed
+            sims = self._vectors @ q
+            best = int(sims.argmax())
+            if sims[best] < threshold:
+                return None
+            self._touch(best)
+            return _loads(self._values[-1])
+
+    def add(self, embedding: list[float], value: dict) -> None:
+        q = _unit(embedding)
+        if q is None:
+            return
+        raw = _dumps(value)
+        with self._lock:
+            self._load()
+            if self._vectors is None or self._vectors.shape[1] != q.shape[0]:
+                self._vectors = q[np.newaxis, :]
+                self._values = [raw]
+            else:
+                self._vectors = np.vstack([self._vectors, q])[-self.max_entries:]
+                self._values = (self._values + [raw])[-self.max_entries:]
+            self._save()
+
+    def _touch(self, i: int) -> None:
+        """Move entry *i* to the most-recently-used end."""
+        order = np.r_[0:i, i + 1:len(self._values), i]
+        self._vectors = self._vectors[order]
+        self._values.append(self._values.pop(i))
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            vectors = np.load(self.cache_dir / "vectors.npy")
+            values = _loads((self.cache_dir / "values.json").read_bytes())
+        except (OSError, ValueError):
+            return
+        if vectors.ndim == 2 and len(vectors) == len(values):
+            self._vectors, self._values = vectors.astype(np.float32, copy=False), values
+
+    def _save(self) -> None:
+        """Best-effort atomic persist of both files."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_vec = tempfile.mkstemp(dir=self.cache_dir, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, self._vectors)
+            fd, tmp_val = tempfile.mkstemp(dir=self.cache_dir, suffix=".json.tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_dumps(self._values))
+            os.replace(tmp_vec, self.cache_dir / "vectors.npy")
+            os.replace(tmp_val, self.cache_dir / "values.json")
+        except OSError as exc:
+            logger.warning("Semantic cache write failed (%s): %s", self.cache_dir.name, exc)
+
+
+def _unit(embedding: list[float]) -> Optional[np.ndarray]:
+    v = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm else None
@@ -17,17 +17,30 @@ Given a free-form problem or challenge, it calls OpenAI once and returns:
     ]
   }
 Falls back to {"reasoning": "", "agents": []} on any error.
+
+Successful designs are kept in a semantic cache: a problem whose embedding is
+close enough to an earlier one (e.g. "build vs buy a recommendation engine"
+and "should we build or buy a recsys") reuses that team without an LLM call.
 """
 
-import json
 import logging
+from typing import Any, Optional
 
 from agno.agent import Agent
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from config import get_agno_model
+from agents._llm_cache import LLMCache, SemanticCache
+from config import EMBEDDING_MODEL, get_agno_model, make_openai_client
 
 logger = logging.getLogger(__name__)
 
+_design_cache = SemanticCache("designer")
+# Embeddings are deterministic per (model, text): memoised in memory and on disk
+_embedding_cache = LLMCache("embeddings", max_memory_entries=4096)
+
+# Key sanitising: spaces and hyphens become underscores in one pass
+_KEY_TRANSLATE = str.maketrans({" ": "_", "-": "_"})
+
 DESIGNER_SYSTEM = """You are an expert at designing AI agent teams for complex problem-solving.
 
 Given a problem or challenge, you:
@@ -59,9 +72,39 @@ Output format:
 }"""
 
 
+class _AgentSpec(BaseModel):
+    """One proposed agent; entries that fail validation are dropped."""
+    key: str = Field(min_length=1)
+    label: str = Field(min_length=1)
+    system_prompt: str = Field(min_length=1)
+    emoji: str = "🤖"
+    description: str = ""
+    category: str = ""
+
+    @field_validator("emoji", "description", "category", mode="before")
+    @classmethod
+    def _null_to_default(cls, value, info):
+        # An explicit null means "not given", as with the old .get() parsing
+        return cls.model_fields[info.field_name].default if value is None else value
+
+
+class _DesignerReply(BaseModel):
+    reasoning: str = ""
+    agents: list[Any]  # validated one by one so a bad entry doesn't sink the rest
+
+    @field_validator("reasoning", mode="before")
+    @classmethod
+    def _null_reasoning(cls, value):
+        return "" if value is None else value
+
+
 class AgentDesigner:
-    def __init__(self):
-        pass
+    def __init__(self, use_cache: bool = False, similarity_threshold: float = 0.92):
+        """use_cache: reuse the stored design for a near-duplicate problem
+        (semantic cache, persisted across restarts). Off by default, since
+        designs are meant to vary; callers opt in."""
+        self.use_cache = use_cache
+        self.similarity_threshold = similarity_threshold
 
     def design(self, problem: str) -> dict:
         """
@@ -71,55 +114,81 @@ class AgentDesigner:
                                     system_prompt, category)
         Falls back to {"reasoning": "", "agents": []} on any error.
         """
+        problem = problem.strip()
+        embedding = _embed(problem) if self.use_cache else None
+        if embedding is not None:
+            cached = _design_cache.lookup(embedding, self.similarity_threshold)
+            if cached is not None:
+                return cached
+
         user_message = f"""Problem or challenge to solve:
 
-{problem.strip()}
+{problem}
 
 Please identify the domain experts needed and propose a specialist agent team."""
 
         try:
             agent = Agent(
                 name="AgentDesigner",
-                model=get_agno_model(max_tokens=2000),
+                model=get_agno_model(max_tokens=2000, json_mode=True),
                 instructions=DESIGNER_SYSTEM,
                 markdown=False,
                 add_datetime_to_context=False,
             )
             result_output = agent.run(input=user_message)
             raw = result_output.content.strip() if isinstance(result_output.content, str) else str(result_output.content).strip()
-            result = json.loads(raw)
-
-            # Validate top-level shape
-            if "reasoning" not in result or "agents" not in result:
-                raise ValueError("Missing required keys: 'reasoning' and/or 'agents'")
+            # Parse and validate the top-level shape in one pass; a missing
+            # 'agents' raises and falls through to the fallback
+            reply = _DesignerReply.model_validate_json(raw)
 
             # Validate and filter agent entries
             valid_agents = []
             seen_keys = set()
-            for agent in result.get("agents", []):
-                if not isinstance(agent, dict):
-                    continue
-                if not agent.get("key") or not agent.get("label") or not agent.get("system_prompt"):
+            for entry in reply.agents:
+                try:
+                    spec = _AgentSpec.model_validate(entry)
+                except ValidationError:
                     continue
                 # Sanitise key: lowercase snake_case, deduplicate within this result
-                key = agent["key"].lower().replace(" ", "_").replace("-", "_")
-                if key in seen_keys:
-                    key = f"{key}_2"
+                key = base = spec.key.lower().translate(_KEY_TRANSLATE)
+                suffix = 1
+                while key in seen_keys:  # cost_analyst, cost_analyst_2, cost_analyst_3, ...
+                    suffix += 1
+                    key = f"{base}_{suffix}"
                 seen_keys.add(key)
                 valid_agents.append({
                     "key": key,
-                    "label": agent.get("label", ""),
-                    "emoji": agent.get("emoji", "🤖"),
-                    "description": agent.get("description", ""),
-                    "system_prompt": agent.get("system_prompt", ""),
-                    "category": agent.get("category", "").strip(),
+                    "label": spec.label,
+                    "emoji": spec.emoji,
+                    "description": spec.description,
+                    "system_prompt": spec.system_prompt,
+                    "category": spec.category.strip(),
                 })
 
-            return {
-                "reasoning": result.get("reasoning", ""),
+            design = {
+                "reasoning": reply.reasoning,
                 "agents": valid_agents,
             }
+            if embedding is not None and valid_agents:
+                _design_cache.add(embedding, design)
+            return design
 
         except Exception as exc:
             logger.exception("AgentDesigner failed: %s", exc)
             return {"reasoning": "", "agents": []}
+
+
+def _embed(text: str) -> Optional[list[float]]:
+    """Embedding for the semantic cache, or None (cache skipped) on any error."""
+    key = LLMCache.key(EMBEDDING_MODEL, "embedding", text, None)
+    cached = _embedding_cache.get(key)
+    if cached is not None:
+        return cached["embedding"]
+    try:
+        response = make_openai_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+        embedding = response.data[0].embedding
+        _embedding_cache.set(key, {"embedding": embedding})
+        return embedding
+    except Exception as exc:
+        logger.warning("AgentDesigner embedding failed, skipping cache: %s", exc)
+        return None
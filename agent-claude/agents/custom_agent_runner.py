@@ -6,13 +6,16 @@ into an Agno Agent instance.  The Agno Agent handles the LLM call, tool-call
 loop, and result assembly automatically.
 """
 
+import asyncio
+import functools
+import inspect
 import logging
 from typing import Generator, Optional
 
 from agno.agent import Agent, RunEvent
 from agno.models.message import Message
 
-from config import get_agno_model
+from config import CONCISE_MODEL, MODEL, get_agno_model
 from models.workroom import CustomAgent
 
 logger = logging.getLogger(__name__)
@@ -51,6 +54,10 @@ _FRUSTRATION_MODE_CONSTRAINT = (
 # Turn-awareness thresholds
 _DELIVERY_TURN_THRESHOLD = 3  # After this many user messages, prioritise delivery
 
+# History sent per call: at most this many chars (~4 chars per token), newest
+# turns first, within the 12/8 message window
+_HISTORY_MAX_CHARS = 16000
+
 # Focused mode constraint — single agent, richer formatting allowed
 _FOCUSED_CONSTRAINT = (
     "\n\nYou are the sole active agent in a focused workroom session. "
@@ -62,6 +69,19 @@ _FOCUSED_CONSTRAINT = (
 )
 
 
+# Replies where the model claimed it couldn't see the uploaded document; they
+# are kept out of history so the model doesn't repeat the claim
+_CONFUSED_REPLY_MARKERS = ("cannot access", "i need to extract")
+
+
+@functools.lru_cache(maxsize=512)
+def _is_confused_reply(content: str) -> bool:
+    """Memoised per message text; history strings are reused across turns and
+    cache their own hash, so a repeat check is a dict lookup, not a scan."""
+    lc = content.casefold()
+    return any(m in lc for m in _CONFUSED_REPLY_MARKERS)
+
+
 def _build_toolkit_factories() -> dict:
     """Lazy-loaded factory dict for Agno Toolkit instances.
 
@@ -127,37 +147,117 @@ def _resolve_tools(skill_names: list[str] | None) -> list:
     return tools
 
 
+def _to_async_tool(func):
+    """Async twin of a plain tool function that runs it in a worker thread.
+
+    functools.wraps keeps the signature and docstring Agno builds the schema
+    from, while the blocking body stays off the caller's event loop.
+    """
+    @functools.wraps(func)
+    async def _tool(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return _tool
+
+
 class CustomAgentRunner:
     def __init__(self, agent_def: CustomAgent, storage=None):
         self.agent_def = agent_def
         self._storage = storage
         self._tools = _resolve_tools(agent_def.skill_names)
+        self._async_tools: list | None = None  # built on first arespond()
 
-    def respond(
+    def _get_async_tools(self) -> list:
+        """Tools for arespond(): plain functions become thread-offloaded coroutines.
+
+        Toolkit instances are passed through unchanged.
+        """
+        if self._async_tools is None:
+            self._async_tools = [
+                _to_async_tool(t) if inspect.isfunction(t) and not inspect.iscoroutinefunction(t) else t
+                for t in self._tools
+            ]
+        return self._async_tools
+
+    def _build_instructions(
         self,
-        message: str,
-        conversation_history: list | None = None,
-        document_context: dict | None = None,
-        concise: bool = False,
-        focused: bool = False,
-        doc_context: str = "",
-        frustration_detected: bool = False,
+        concise: bool,
+        focused: bool,
+        doc_context: str,
+        document_context: dict | None,
     ) -> str:
-        # ---- Build dynamic instructions ----
-        instructions = self.agent_def.system_prompt
+        """System prompt, ordered most-stable first.
+
+        The agent's own prompt and mode constraints never change within a
+        session and the document block only changes when a doc is uploaded, so
+        this whole string is a byte-stable prefix the provider's prompt cache
+        can reuse turn after turn. Per-turn signals go in _build_messages().
+        """
+        # Each constraint carries its own leading "\n\n", so parts join with ""
+        parts = [self.agent_def.system_prompt]
         if focused:
-            instructions += _FOCUSED_CONSTRAINT
+            parts.append(_FOCUSED_CONSTRAINT)
         elif concise:
-            instructions += _CONCISE_CONSTRAINT
+            parts.append(_CONCISE_CONSTRAINT)
 
         # Always add action-bias to reduce clarification loops
         if concise or focused:
-            instructions += _ACTION_BIAS_CONSTRAINT
+            parts.append(_ACTION_BIAS_CONSTRAINT)
+
+        if doc_context:
+            parts.append(f"\n\n{doc_context}")
+        elif document_context:
+            filename = document_context.get("filename", "the uploaded document")
+            doc_text = document_context.get("text", "")[:8000]
+            parts.append(
+                f"\n\nA reference document has been uploaded to this session: **{filename}**. "
+                "Its full text is embedded below under 'Document context'. You already have "
+                "access to all of its content — do NOT say you cannot access the file. "
+                "Read the embedded text and use it to answer."
+                f"\n\nDocument context ({filename}):\n---\n{doc_text}\n---"
+            )
+        return "".join(parts)
 
+    def _build_messages(
+        self,
+        message: str,
+        conversation_history: list | None,
+        concise: bool,
+        frustration_detected: bool,
+    ) -> list[Message]:
+        """History, then this turn's volatile guidance, then the user message.
+
+        Turn awareness and frustration mode change from turn to turn, so they
+        sit after the history rather than inside the cached system prompt.
+        """
+        messages: list[Message] = []
+        history_window = 12 if concise else 8
+        budget = _HISTORY_MAX_CHARS
+        # Walk newest to oldest so a long reply crowds out old turns, not recent ones
+        for msg in reversed((conversation_history or [])[-history_window:]):
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if not content or role not in ("user", "assistant"):
+                continue
+            if _is_confused_reply(content):
+                continue
+            if budget <= 0:
+                break
+            if len(content) > budget:
+                if messages:
+                    break  # older turn doesn't fit; keep history contiguous
+                # The newest turn is always kept, clipped from the end so a
+                # long draft keeps its opening sections
+                content = content[:budget - 1] + "…"
+            budget -= len(content)
+            messages.append(Message(role=role, content=content))
+        messages.reverse()
+
+        turn_guidance: list[str] = []
         # Turn-awareness: after enough user messages, push agents to deliver
         user_turn_count = sum(1 for m in (conversation_history or []) if m.get("role") == "user")
         if user_turn_count >= _DELIVERY_TURN_THRESHOLD:
-            instructions += (
+            turn_guidance.append(
                 f"\n\nTURN AWARENESS: The user has sent {user_turn_count} messages in this session. "
                 "You MUST deliver concrete, actionable output now — not ask more questions. "
                 "State assumptions and provide a complete answer."
@@ -165,68 +265,81 @@ class CustomAgentRunner:
 
         # Frustration mode: override to pure delivery
         if frustration_detected:
-            instructions += _FRUSTRATION_MODE_CONSTRAINT
+            turn_guidance.append(_FRUSTRATION_MODE_CONSTRAINT)
 
-        if doc_context:
-            instructions += f"\n\n{doc_context}"
-        elif document_context:
-            filename = document_context.get("filename", "the uploaded document")
-            instructions += (
-                f"\n\nA reference document has been uploaded to this session: **{filename}**. "
-                "The full text of this document is embedded directly in the user message under "
-                "'Document context'. You already have access to all of its content — do NOT say "
-                "you cannot access the file. Read the embedded text and use it to answer."
-            )
+        if turn_guidance:
+            messages.append(Message(role="system", content="".join(turn_guidance).strip()))
+        messages.append(Message(role="user", content=message))
+        return messages
 
-        # ---- Build Agno Agent for this call ----
+    def _make_agent(self, instructions: str, tools: list, concise: bool = False) -> Agent:
+        """Agno Agent for one call; respond(), arespond() and respond_stream() share it.
+
+        Agno's sync run loop executes a round's tool calls one after another
+        and exposes no executor hook. The plain skills are in-process lookups
+        and WebSearchTools caches its results, so rounds stay tool-cheap; the
+        latency is in the model round trips, which tool_call_limit bounds.
+        """
         deps = {"storage": self._storage} if self._storage else {}
-        agent = Agent(
+        return Agent(
             name=self.agent_def.label,
-            model=get_agno_model(max_tokens=2000),
+            model=get_agno_model(max_tokens=2000, model=CONCISE_MODEL if concise else MODEL),
             instructions=instructions,
-            tools=self._tools or None,
+            tools=tools or None,
             tool_call_limit=5,
             dependencies=deps,
             markdown=True,
             add_datetime_to_context=False,
         )
 
-        # ---- Build conversation input ----
-        messages: list[Message] = []
-        history_window = 12 if concise else 8
-        if conversation_history:
-            for msg in conversation_history[-history_window:]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if not content or role not in ("user", "assistant"):
-                    continue
-                if "cannot access" in content.lower() or "i need to extract" in content.lower():
-                    continue
-                messages.append(Message(role=role, content=content))
-
-        # Build user message with optional doc text
-        user_content = message
-        if document_context and not doc_context:
-            doc_text = document_context.get("text", "")[:8000]
-            user_content = (
-                f"Document context ({document_context.get('filename', '')}):\n"
-                f"---\n{doc_text}\n---\n\n{message}"
-            )
-        messages.append(Message(role="user", content=user_content))
+    def _unavailable_text(self) -> str:
+        return (
+            f"_({self.agent_def.label} is temporarily unavailable due to a "
+            "connection issue. Please try again.)_"
+        )
 
-        # ---- Run agent ----
+    def respond(
+        self,
+        message: str,
+        conversation_history: list | None = None,
+        document_context: dict | None = None,
+        concise: bool = False,
+        focused: bool = False,
+        doc_context: str = "",
+        frustration_detected: bool = False,
+    ) -> str:
+        instructions = self._build_instructions(concise, focused, doc_context, document_context)
+        messages = self._build_messages(message, conversation_history, concise, frustration_detected)
         try:
-            result = agent.run(input=messages)
-            content = result.content if result.content else ""
-            if isinstance(content, str):
-                return content.strip()
-            return str(content).strip()
+            result = self._make_agent(instructions, self._tools, concise).run(input=messages)
+            return _result_text(result)
         except Exception as exc:
             logger.exception("CustomAgentRunner API error: %s", exc)
-            return (
-                f"_({self.agent_def.label} is temporarily unavailable due to a "
-                "connection issue. Please try again.)_"
-            )
+            return self._unavailable_text()
+
+    async def arespond(
+        self,
+        message: str,
+        conversation_history: list | None = None,
+        document_context: dict | None = None,
+        concise: bool = False,
+        focused: bool = False,
+        doc_context: str = "",
+        frustration_detected: bool = False,
+    ) -> str:
+        """Awaitable variant of respond() for callers running an event loop.
+
+        Runs the agent with Agno's async path, so the model request doesn't
+        block the loop and blocking skills execute in worker threads.
+        """
+        instructions = self._build_instructions(concise, focused, doc_context, document_context)
+        messages = self._build_messages(message, conversation_history, concise, frustration_detected)
+        try:
+            result = await self._make_agent(instructions, self._get_async_tools(), concise).arun(input=messages)
+            return _result_text(result)
+        except Exception as exc:
+            logger.exception("CustomAgentRunner API error: %s", exc)
+            return self._unavailable_text()
 
     def respond_stream(
         self,
@@ -239,85 +352,21 @@ class CustomAgentRunner:
         frustration_detected: bool = False,
     ) -> Generator[str, None, None]:
         """Streaming variant of respond(). Yields text chunks as they arrive."""
-        # ---- Build dynamic instructions (same as respond) ----
-        instructions = self.agent_def.system_prompt
-        if focused:
-            instructions += _FOCUSED_CONSTRAINT
-        elif concise:
-            instructions += _CONCISE_CONSTRAINT
-
-        # Always add action-bias to reduce clarification loops
-        if concise or focused:
-            instructions += _ACTION_BIAS_CONSTRAINT
-
-        # Turn-awareness: after enough user messages, push agents to deliver
-        user_turn_count = sum(1 for m in (conversation_history or []) if m.get("role") == "user")
-        if user_turn_count >= _DELIVERY_TURN_THRESHOLD:
-            instructions += (
-                f"\n\nTURN AWARENESS: The user has sent {user_turn_count} messages in this session. "
-                "You MUST deliver concrete, actionable output now — not ask more questions. "
-                "State assumptions and provide a complete answer."
-            )
-
-        # Frustration mode: override to pure delivery
-        if frustration_detected:
-            instructions += _FRUSTRATION_MODE_CONSTRAINT
-
-        if doc_context:
-            instructions += f"\n\n{doc_context}"
-        elif document_context:
-            filename = document_context.get("filename", "the uploaded document")
-            instructions += (
-                f"\n\nA reference document has been uploaded to this session: **{filename}**. "
-                "The full text of this document is embedded directly in the user message under "
-                "'Document context'. You already have access to all of its content — do NOT say "
-                "you cannot access the file. Read the embedded text and use it to answer."
-            )
-
-        # ---- Build Agno Agent ----
-        deps = {"storage": self._storage} if self._storage else {}
-        agent = Agent(
-            name=self.agent_def.label,
-            model=get_agno_model(max_tokens=2000),
-            instructions=instructions,
-            tools=self._tools or None,
-            tool_call_limit=5,
-            dependencies=deps,
-            markdown=True,
-            add_datetime_to_context=False,
-        )
-
-        # ---- Build conversation input (same as respond) ----
-        messages: list[Message] = []
-        history_window = 12 if concise else 8
-        if conversation_history:
-            for msg in conversation_history[-history_window:]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if not content or role not in ("user", "assistant"):
-                    continue
-                if "cannot access" in content.lower() or "i need to extract" in content.lower():
-                    continue
-                messages.append(Message(role=role, content=content))
-
-        user_content = message
-        if document_context and not doc_context:
-            doc_text = document_context.get("text", "")[:8000]
-            user_content = (
-                f"Document context ({document_context.get('filename', '')}):\n"
-                f"---\n{doc_text}\n---\n\n{message}"
-            )
-        messages.append(Message(role="user", content=user_content))
-
-        # ---- Run agent with streaming ----
+        instructions = self._build_instructions(concise, focused, doc_context, document_context)
+        messages = self._build_messages(message, conversation_history, concise, frustration_detected)
         try:
+            agent = self._make_agent(instructions, self._tools, concise)
             for chunk in agent.run(input=messages, stream=True):
                 if hasattr(chunk, "event") and chunk.event == RunEvent.run_content.value:
                     if chunk.content:
                         yield str(chunk.content)
         except Exception as exc:
             logger.exception("CustomAgentRunner streaming error: %s", exc)
-            yield (
-                f"_({self.agent_def.label} is temporarily unavailable due to a "
-                "connection issue. Please try again.)_"
-            )
+            yield self._unavailable_text()
+
+
+def _result_text(result) -> str:
+    content = result.content if result.content else ""
+    if isinstance(content, str):
+        return content.strip()
+    return str(content).strip()
@@ -5,11 +5,13 @@ Responsibilities:
   1. open_session()      — generates the opening message when a workroom is created
   2. should_summarise()  — returns True every N user messages
   3. generate_summary()  — synthesises progress and suggests next focus
+     (generate_summary_stream() yields it chunk by chunk)
 """
 
 import logging
+from typing import Generator
 
-from agno.agent import Agent
+from agno.agent import Agent, RunEvent
 from agno.models.message import Message
 
 from config import get_agno_model
@@ -28,20 +30,34 @@ Your role:
 """
 
 
-def _run_facilitator(prompt: str, max_tokens: int = 2000) -> str:
-    """Create a one-shot facilitator agent and run it."""
-    agent = Agent(
+_SUMMARY_FALLBACK = "**Facilitator check-in:** Let's pause and review progress. What has been decided so far, and what still needs resolution?"
+
+
+def _make_facilitator(max_tokens: int) -> Agent:
+    return Agent(
         name="Facilitator",
         model=get_agno_model(max_tokens=max_tokens),
         instructions=FACILITATOR_SYSTEM,
         markdown=True,
         add_datetime_to_context=False,
     )
-    result = agent.run(input=prompt)
+
+
+def _run_facilitator(prompt: str, max_tokens: int = 2000) -> str:
+    """Create a one-shot facilitator agent and run it."""
+    result = _make_facilitator(max_tokens).run(input=prompt)
     content = result.content if result.content else ""
     return content.strip() if isinstance(content, str) else str(content).strip()
 
 
+def _stream_facilitator(prompt: str, max_tokens: int = 2000) -> Generator[str, None, None]:
+    """Streaming variant of _run_facilitator(). Yields text chunks as they arrive."""
+    for chunk in _make_facilitator(max_tokens).run(input=prompt, stream=True):
+        if hasattr(chunk, "event") and chunk.event == RunEvent.run_content.value:
+            if chunk.content:
+                yield str(chunk.content)
+
+
 class FacilitatorAgent:
     def __init__(self):
         pass
@@ -101,6 +117,21 @@ Keep the total length under 200 words."""
         Reads recent conversation and produces a concise progress summary
         with suggested next focus.
         """
+        try:
+            return _run_facilitator(self._summary_prompt(messages, objective), max_tokens=2000)
+        except Exception as exc:
+            logger.exception("FacilitatorAgent.generate_summary failed: %s", exc)
+            return _SUMMARY_FALLBACK
+
+    def generate_summary_stream(self, messages: list[dict], objective: str) -> Generator[str, None, None]:
+        """Streaming variant of generate_summary(). Yields text chunks as they arrive."""
+        try:
+            yield from _stream_facilitator(self._summary_prompt(messages, objective), max_tokens=2000)
+        except Exception as exc:
+            logger.exception("FacilitatorAgent.generate_summary_stream failed: %s", exc)
+            yield _SUMMARY_FALLBACK
+
+    def _summary_prompt(self, messages: list[dict], objective: str) -> str:
         recent = messages[-20:]
         transcript_lines = []
         for m in recent:
@@ -114,7 +145,7 @@ Keep the total length under 200 words."""
                 transcript_lines.append(f"{label}: {content[:300]}{'...' if len(content) > 300 else ''}")
         transcript = "\n".join(transcript_lines)
 
-        prompt = f"""You are facilitating a workroom session with this objective:
+        return f"""You are facilitating a workroom session with this objective:
 "{objective}"
 
 Recent conversation transcript:
@@ -128,9 +159,3 @@ Write a brief facilitator check-in (under 150 words) that:
 3. Suggests what to focus on next
 
 Use markdown formatting."""
-
-        try:
-            return _run_facilitator(prompt, max_tokens=2000)
-        except Exception as exc:
-            logger.exception("FacilitatorAgent.generate_summary failed: %s", exc)
-            return "**Facilitator check-in:** Let's pause and review progress. What has been decided so far, and what still needs resolution?"
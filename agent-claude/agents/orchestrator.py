@@ -19,12 +19,13 @@ Routing table:
 """
 
 import re
+import threading
 from typing import Generator, Optional
 
 from agno.agent import Agent
 from agno.models.message import Message
 
-from config import get_agno_model
+from config import MAX_CONCURRENT_AGENT_CALLS, get_agno_model
 from storage import StorageManager
 from agents.custom_agent_runner import CustomAgentRunner
 from agents.facilitator_agent import FacilitatorAgent
@@ -99,6 +100,9 @@ DECISION_KEYWORDS_WEAK = [
 # Minimum length for decision detection — short advisory sentences are not decisions
 _DECISION_MIN_LENGTH = 120
 
+# Shared across all round tables in the process (e.g. concurrent eval sessions)
+_AGENT_CALL_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_AGENT_CALLS)
+
 # ------------------------------------------------------------------ #
 # Frustration / impatience detection                                  #
 # ------------------------------------------------------------------ #
@@ -284,6 +288,7 @@ class Orchestrator:
         "warning": str | None, # Low-data warning etc.
         "pending_action": str | None,  # e.g. "confirm_requests"
         "pending_data": any,   # Data waiting for PM confirmation
+        "is_fallback": bool,   # Only set (True) when no route matched
       }
     """
 
@@ -291,9 +296,14 @@ class Orchestrator:
         self.storage = storage
         # Custom agent runners — loaded lazily from storage
         self._custom_runners: dict[str, CustomAgentRunner] = {}
+        # Custom agent definitions keyed by agent key, re-read only when
+        # custom_agents.json changes: (storage version, {key: CustomAgent})
+        self._custom_defs: tuple[int, dict[str, CustomAgent]] = (-1, {})
 
         # Document summary cache: {filename: summary_text}
         self._doc_summary_cache: dict[str, str] = {}
+        # Formatted prompt block per document: {filename: block}
+        self._doc_block_cache: dict[str, str] = {}
 
     # ------------------------------------------------------------------ #
     # Document summarization (one-time, cached)                           #
@@ -354,31 +364,80 @@ class Orchestrator:
     def _get_doc_context_block(self, document_context: Optional[dict]) -> str:
         """Build a compact context block from a document for injection into agent prompts.
 
-        Returns empty string if no document context.
+        Returns empty string if no document context. The block is built once
+        per document, like its summary, so every turn and agent gets the
+        same string.
         """
         if not document_context:
             return ""
         filename = document_context.get("filename", "document")
+        if filename in self._doc_block_cache:
+            return self._doc_block_cache[filename]
         summary = self.summarize_document(document_context)
         if not summary:
             return ""
-        return (
+        block = (
             f"\n\n📄 Reference Document: **{filename}**\n"
             f"Summary:\n{summary[:_DOC_SUMMARY_MAX_CHARS]}\n\n"
             "GROUNDING RULE: First, cite 1-2 specific facts from this document that are most relevant "
             "to your expertise and the current question. Then give your analysis building on those facts. "
             "Do NOT ask generic questions that the document already answers."
         )
+        self._doc_block_cache[filename] = block
+        return block
+
+    def _agent_context_block(
+        self,
+        key: str,
+        document_context: Optional[dict],
+        active_agents: Optional[list],
+        is_workroom: bool,
+        research_context: str = "",
+    ) -> str:
+        """doc_context for a workroom agent: team roster, document, then research.
+
+        Shared by _route_by_key() and route_by_key_stream() so both paths send
+        the same bytes. The per-turn research context goes last, after the
+        parts that stay fixed for the session.
+        """
+        if not is_workroom:
+            return research_context
+
+        # Team-awareness: tell each agent who else is in the room
+        team_block = ""
+        if active_agents and len(active_agents) > 1:
+            other_agents = [a for a in active_agents if a != key]
+            if other_agents:
+                team_block = (
+                    f"\n\n👥 Team context: Other agents present: {', '.join(other_agents)}. "
+                    f"Focus on YOUR unique specialty — do not duplicate what "
+                    f"{', '.join(other_agents)} would cover. "
+                    "If a point overlaps with another agent's area, mention it briefly and move on."
+                )
+        return team_block + self._get_doc_context_block(document_context) + research_context
+
+    def _custom_agents_by_key(self) -> dict[str, CustomAgent]:
+        """Return all custom agent definitions from a single storage read.
+
+        The map is reused until custom_agents.json changes on disk.
+        """
+        version = self.storage.custom_agents_version()
+        if self._custom_defs[0] != version:
+            defs: dict[str, CustomAgent] = {}
+            for ca in self.storage.list_custom_agents():
+                defs.setdefault(ca.key, ca)
+            self._custom_defs = (version, defs)
+        return self._custom_defs[1]
 
     def _get_custom_runner(self, key: str) -> Optional[CustomAgentRunner]:
         if key in self._custom_runners:
             return self._custom_runners[key]
-        for ca in self.storage.list_custom_agents():
-            if ca.key == key:
-                runner = CustomAgentRunner(ca, storage=self.storage)
-                self._custom_runners[key] = runner
-                return runner
-        return None
+        ca = self._custom_agents_by_key().get(key)
+        if ca is None:
+            return None
+        runner = CustomAgentRunner(ca, storage=self.storage)
+        self._custom_runners[key] = runner
+        return runner
 
     def handle_message(
         self,
@@ -410,12 +469,12 @@ class Orchestrator:
         # ---- @mention: direct routing (supports multiple @mentions) ----
         # Build full list of all known agent keys for mention detection
         all_known = list(MENTION_MAP.values())
-        for ca in self.storage.list_custom_agents():
-            all_known.append(ca.key)
+        all_known.extend(self._custom_agents_by_key())
         mention_keys = _detect_mentions(message, active_agents, all_known_agents=all_known)
         if mention_keys:
             # Check if mentioned agents are in this session
-            not_in_session = [k for k in mention_keys if active_agents and k not in active_agents]
+            active_set = frozenset(active_agents or ())
+            not_in_session = [k for k in mention_keys if active_set and k not in active_set]
             if not_in_session:
                 labels = ", ".join(f"**{k}**" for k in not_in_session)
                 active_list = ", ".join(active_agents or [])
@@ -493,11 +552,13 @@ class Orchestrator:
         if "researcher" in active_list:
             examples.append("- **Research a topic**: 'Research: [topic]' or 'Deep dive on [subject]'")
 
-        return self._respond(
+        result = self._respond(
             "[System]",
             "I'm not sure what you'd like to do. Here are your options with the active agents:\n\n"
             + "\n".join(examples),
         )
+        result["is_fallback"] = True
+        return result
 
     # ------------------------------------------------------------------ #
     # Agent availability helpers                                          #
@@ -622,25 +683,9 @@ class Orchestrator:
             return self._agent_blocked(key.capitalize(), active_agents)
 
         is_workroom = workroom is not None
-
-        # Build document context block (summary) for agent injection
-        doc_block = self._get_doc_context_block(document_context) if is_workroom else ""
-
-        # Append research context from agent chaining (if any)
-        if research_context:
-            doc_block += research_context
-
-        # Team-awareness: tell each agent who else is in the room
-        if is_workroom and active_agents and len(active_agents) > 1:
-            other_agents = [a for a in active_agents if a != key]
-            if other_agents:
-                team_block = (
-                    f"\n\n👥 Team context: Other agents present: {', '.join(other_agents)}. "
-                    f"Focus on YOUR unique specialty — do not duplicate what "
-                    f"{', '.join(other_agents)} would cover. "
-                    "If a point overlaps with another agent's area, mention it briefly and move on."
-                )
-                doc_block = team_block + doc_block
+        doc_block = self._agent_context_block(
+            key, document_context, active_agents, is_workroom, research_context,
+        )
 
         if key == "facilitator":
             fac = FacilitatorAgent()
@@ -682,33 +727,13 @@ class Orchestrator:
             return None
 
         is_workroom = workroom is not None
+        doc_block = self._agent_context_block(
+            key, document_context, active_agents, is_workroom, research_context,
+        )
 
-        # Build document context block (summary) for agent injection
-        doc_block = self._get_doc_context_block(document_context) if is_workroom else ""
-
-        # Append research context from agent chaining (if any)
-        if research_context:
-            doc_block += research_context
-
-        # Team-awareness
-        if is_workroom and active_agents and len(active_agents) > 1:
-            other_agents = [a for a in active_agents if a != key]
-            if other_agents:
-                team_block = (
-                    f"\n\n👥 Team context: Other agents present: {', '.join(other_agents)}. "
-                    f"Focus on YOUR unique specialty — do not duplicate what "
-                    f"{', '.join(other_agents)} would cover. "
-                    "If a point overlaps with another agent's area, mention it briefly and move on."
-                )
-                doc_block = team_block + doc_block
-
-        # Facilitator: fall back to non-streaming (yields full text)
         if key == "facilitator":
             fac = FacilitatorAgent()
-            summary = fac.generate_summary(conversation_history or [], message)
-            def _yield_full():
-                yield summary
-            return "[Facilitator]", _yield_full()
+            return "[Facilitator]", fac.generate_summary_stream(conversation_history or [], message)
 
         # Custom agent — use streaming
         runner = self._get_custom_runner(key)
@@ -934,7 +959,8 @@ class Orchestrator:
             # Validate: must be a list of strings that are in active_agents
             if not isinstance(selected, list):
                 selected = active_agents
-            selected = [k for k in selected if k in active_agents]
+            active_set = frozenset(active_agents)
+            selected = [k for k in selected if k in active_set]
             if not selected:
                 selected = active_agents
         except Exception:
@@ -1099,7 +1125,8 @@ class Orchestrator:
 
             if not isinstance(selected, list):
                 return None
-            selected = [k for k in selected if k in active_agents]
+            active_set = frozenset(active_agents)
+            selected = [k for k in selected if k in active_set]
             if not selected:
                 return None
         except Exception:
@@ -1159,6 +1186,12 @@ class Orchestrator:
         When multiple agents respond, a deduplication pass removes redundant
         content so each agent adds distinct value.
 
+        Each agent is deliberately its own call rather than one combined
+        multi-persona prompt: agents carry their own system prompt and tools,
+        and the calls already overlap, so merging them would save only the
+        repeated document/history tokens at the cost of every persona
+        sharing one voice and one tool loop.
+
         Returns:
             {
               "agent": "[Round Table]",
@@ -1169,14 +1202,13 @@ class Orchestrator:
               ...
             }
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor
         import logging
 
         logger = logging.getLogger(__name__)
 
         # Determine which agents to call
         all_builtin = ["facilitator"]
-        custom_keys = [ca.key for ca in self.storage.list_custom_agents()]
 
         if active_agents:
             ordered = [k for k in all_builtin if k in active_agents]
@@ -1187,12 +1219,13 @@ class Orchestrator:
         def _call_agent(key: str) -> dict:
             """Call a single agent with retry logic. Runs in a thread."""
             try:
-                result = self._route_by_key(
-                    key, message, list(conversation_history or []),
-                    document_context, active_agents, workroom=workroom,
-                    frustration_detected=frustration_detected,
-                    research_context=research_context,
-                )
+                with _AGENT_CALL_SLOTS:
+                    result = self._route_by_key(
+                        key, message, list(conversation_history or []),
+                        document_context, active_agents, workroom=workroom,
+                        frustration_detected=frustration_detected,
+                        research_context=research_context,
+                    )
                 return {
                     "key": key,
                     "agent": result.get("agent", f"[{key.capitalize()}]"),
@@ -1203,12 +1236,13 @@ class Orchestrator:
                 import time
                 time.sleep(2)
                 try:
-                    result = self._route_by_key(
-                        key, message, list(conversation_history or []),
-                        document_context, active_agents, workroom=workroom,
-                        frustration_detected=frustration_detected,
-                        research_context=research_context,
-                    )
+                    with _AGENT_CALL_SLOTS:
+                        result = self._route_by_key(
+                            key, message, list(conversation_history or []),
+                            document_context, active_agents, workroom=workroom,
+                            frustration_detected=frustration_detected,
+                            research_context=research_context,
+                        )
                     return {
                         "key": key,
                         "agent": result.get("agent", f"[{key.capitalize()}]"),
@@ -1222,24 +1256,19 @@ class Orchestrator:
                         "text": "_(Temporarily unavailable. Please resend your message to try again.)_",
                     }
 
-        # Fire all agents in parallel
-        results_by_key: dict[str, dict] = {}
+        # Fire all agents in parallel. map() yields results in roster order
+        # whatever order they finish in, so the stored transcript (and the
+        # history later turns send back to the model) is the same on every run.
         with ThreadPoolExecutor(max_workers=len(ordered)) as pool:
-            futures = {pool.submit(_call_agent, key): key for key in ordered}
-            for future in as_completed(futures):
-                result = future.result()
-                results_by_key[result["key"]] = result
+            results = list(pool.map(_call_agent, ordered))
 
-        # Reassemble in original order
         responses: list[dict] = []
-        for key in ordered:
-            r = results_by_key.get(key)
-            if r:
-                responses.append({"agent": r["agent"], "text": r["text"]})
-                # Auto-detect decisions
-                if workroom and _is_decision(r["text"]):
-                    decision = Decision(content=r["text"][:300], context=message[:200])
-                    self.storage.add_workroom_decision(workroom.id, decision)
+        for r in results:
+            responses.append({"agent": r["agent"], "text": r["text"]})
+            # Auto-detect decisions
+            if workroom and _is_decision(r["text"]):
+                decision = Decision(content=r["text"][:300], context=message[:200])
+                self.storage.add_workroom_decision(workroom.id, decision)
 
         # Deduplicate: when multiple agents respond, remove redundant content
         if len(responses) > 1:
@@ -1294,7 +1323,9 @@ class Orchestrator:
             "Here are responses from multiple agents to the same user message. "
             "Edit them to remove redundancy. Each agent should only contain content "
             "unique to their expertise.\n\n"
-            f"{_json.dumps(input_items, indent=2)}"
+            # ensure_ascii=False keeps emoji labels as-is rather than \uXXXX
+            # surrogate escapes the model would have to decode back
+            f"{_json.dumps(input_items, indent=1, ensure_ascii=False)}"
         )
 
         try:
@@ -7,6 +7,9 @@ of available agents, it calls OpenAI once and returns:
     "recommended": ["intake", "analyst", ...],
     "rationale":   {"intake": "one-sentence reason", ...}
   }
+
+Successful results are cached (see agents/_llm_cache.py) keyed on the exact
+prompt, so repeat classifications of the same brief skip the LLM call.
 """
 
 import json
@@ -14,10 +17,20 @@ import logging
 
 from agno.agent import Agent
 
-from config import get_agno_model
+try:  # C-accelerated JSON; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+from agents._llm_cache import LLMCache
+from config import MODEL, get_agno_model
 
 logger = logging.getLogger(__name__)
 
+CLASSIFIER_MAX_TOKENS = 800
+
+_cache = LLMCache("classify")
+
 CLASSIFIER_SYSTEM = """You are an expert meeting facilitator and product management coach.
 
 Your job is to recommend the most relevant AI agents for a focused workroom session,
@@ -61,28 +74,36 @@ class TopicClassifier:
             for a in available_agents
         )
 
-        user_message = f"""Topic: {topic}
+        # The agent roster is the same for every brief, so it goes first: the
+        # system prompt + roster then form a stable prefix that the provider's
+        # prompt cache can reuse, and only the brief below it varies.
+        user_message = f"""Available agents:
+{agent_list_text}
+
+Topic: {topic}
 
 Meeting objective: {objective}
 
 Desired outcome: {outcome}
 
-Available agents:
-{agent_list_text}
-
 Please recommend the best subset of agents for this session."""
 
+        cache_key = LLMCache.key(MODEL, CLASSIFIER_SYSTEM, user_message, CLASSIFIER_MAX_TOKENS)
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             agent = Agent(
                 name="TopicClassifier",
-                model=get_agno_model(max_tokens=800),
+                model=get_agno_model(max_tokens=CLASSIFIER_MAX_TOKENS, json_mode=True),
                 instructions=CLASSIFIER_SYSTEM,
                 markdown=False,
                 add_datetime_to_context=False,
             )
             result_output = agent.run(input=user_message)
             raw = result_output.content.strip() if isinstance(result_output.content, str) else str(result_output.content).strip()
-            result = json.loads(raw)
+            result = orjson.loads(raw) if orjson is not None else json.loads(raw)
             # Validate shape
             if "recommended" not in result or "rationale" not in result:
                 raise ValueError("Missing required keys in classifier response")
@@ -92,6 +113,7 @@ Please recommend the best subset of agents for this session."""
             result["rationale"] = {
                 k: v for k, v in result["rationale"].items() if k in valid_keys
             }
+            _cache.set(cache_key, result)
             return result
         except Exception as exc:
             logger.exception("TopicClassifier failed: %s", exc)
@@ -189,11 +189,19 @@ def _all_agent_options() -> list[dict]:
             "tier": 3,
             "category": ca.category,         # "professional", "life", or ""
             "is_default": ca.is_default,
-            "description": ca.description or ca.system_prompt[:80],
+            "description": ca.effective_description,
         })
     return opts
 
 
+def _agent_options_by_key() -> dict[str, dict]:
+    """Return {key: option dict}; built-in entries win over same-key custom agents."""
+    by_key: dict[str, dict] = {}
+    for a in _all_agent_options():
+        by_key.setdefault(a["key"], a)
+    return by_key
+
+
 def _agent_display_label(agent_dict: dict) -> str:
     """Return a display label for an agent option, with category prefix."""
     emoji = agent_dict.get("emoji", "🤖")
@@ -647,7 +655,7 @@ if page == "chat":
                             if st.session_state.new_workroom_pending_doc:
                                 st.session_state.workroom_active_document = st.session_state.new_workroom_pending_doc
                                 # Persist document context to workroom for cross-session access
-                                new_ws.document_context = st.session_state.new_workroom_pending_doc
+                                new_ws.document_context = storage.store_document_context(st.session_state.new_workroom_pending_doc)
                                 storage.save_workroom(new_ws)
                                 fname = st.session_state.new_workroom_pending_doc["filename"]
                                 init_msgs.append({
@@ -659,11 +667,8 @@ if page == "chat":
 
                             # Generate facilitator opening message
                             facilitator = FacilitatorAgent()
-                            agent_details = []
-                            for ak in final_agents:
-                                ainfo = next((a for a in _all_agent_options() if a["key"] == ak), None)
-                                if ainfo:
-                                    agent_details.append(ainfo)
+                            _opts_by_key = _agent_options_by_key()
+                            agent_details = [_opts_by_key[ak] for ak in final_agents if ak in _opts_by_key]
                             with st.spinner("🎙️ Facilitator is opening the session…"):
                                 opening_msg = facilitator.open_session(new_ws, agent_details)
                             init_msgs.append({
@@ -694,7 +699,7 @@ if page == "chat":
 
             # Auto-restore persisted document context when entering a workroom
             if active_ws.document_context and not st.session_state.workroom_active_document:
-                st.session_state.workroom_active_document = active_ws.document_context
+                st.session_state.workroom_active_document = storage.resolve_document_context(active_ws.document_context)
 
             wmsgs = st.session_state.workroom_messages
 
@@ -746,8 +751,9 @@ if page == "chat":
                 _ag_cols = st.columns(_num_cols)
                 with _ag_cols[0]:
                     st.caption("**Ask:**")
+                _opts_by_key = _agent_options_by_key()
                 for _ai, _ak in enumerate(_agent_btns):
-                    _a_info = next((a for a in _all_agent_options() if a["key"] == _ak), None)
+                    _a_info = _opts_by_key.get(_ak)
                     _btn_label = f"{_a_info.get('emoji', '🤖')} {_a_info['label']}" if _a_info else f"🤖 {_ak}"
                     with _ag_cols[_ai + 1]:
                         if st.button(_btn_label, key=f"mention_{_ak}", use_container_width=True):
@@ -925,7 +931,7 @@ if page == "chat":
                                 )
                             if resp.get("data") and resp["data"].get("document"):
                                 st.session_state.workroom_active_document = resp["data"]["document"]
-                                active_ws.document_context = resp["data"]["document"]
+                                active_ws.document_context = storage.store_document_context(resp["data"]["document"])
                                 storage.save_workroom(active_ws)
                             wmsgs.append({"role": "user", "content": f"📎 Uploaded: {wr_file.name}"})
                             wmsgs.append({
@@ -1234,8 +1240,9 @@ if page == "chat":
                         _user_msg_count = sum(1 for m in wmsgs if m.get("role") == "user")
                         _fac = FacilitatorAgent()
                         if _fac.should_summarise(_user_msg_count, active_ws.facilitator_summary_interval):
-                            with st.spinner("Facilitator summarising…"):
-                                _summary = _fac.generate_summary(wmsgs, active_ws.goal)
+                            with chat_box.chat_message("assistant"):
+                                _render_agent_header("🎙️ Facilitator")
+                                _summary = st.write_stream(_fac.generate_summary_stream(wmsgs, active_ws.goal))
                             wmsgs.append({"role": "assistant", "content": _summary, "agent": "🎙️ Facilitator"})
                             _save_workroom_messages(active_ws.id, wmsgs)
                             st.session_state.workroom_messages = wmsgs
@@ -1268,7 +1275,7 @@ if page == "chat":
                 for _ws in _all_wrs:
                     _mode_icon = "💼" if _ws.mode == "work" else "🎉"
                     _meta = OUTPUT_TYPE_META.get(_ws.output_type, {})
-                    _msg_count = len(storage.load_workroom_messages(_ws.id))
+                    _msg_count = storage.count_workroom_messages(_ws.id)
                     _agent_count = len(_ws.active_agents)
                     _created = _ws.created_at[:10] if _ws.created_at else ""
 
@@ -1467,12 +1474,22 @@ if page == "agent_hub":
             key="explore_problem_input",
         )
 
-        if st.button("Find Experts", key="find_experts_btn", type="primary"):
+        _find_col, _regen_col, _ = st.columns([1, 1, 4])
+        with _find_col:
+            _find_clicked = st.button("Find Experts", key="find_experts_btn", type="primary")
+        with _regen_col:
+            # Bypasses the design cache so the same problem gets a fresh team
+            _regen_clicked = st.button(
+                "🔄 Regenerate", key="regenerate_experts_btn",
+                disabled=not st.session_state.explore_results,
+            )
+
+        if _find_clicked or _regen_clicked:
             if not explore_problem.strip():
                 st.error("Please describe your problem or challenge first.")
             else:
                 with st.spinner("Exploring domain expertise needed..."):
-                    designer = AgentDesigner()
+                    designer = AgentDesigner(use_cache=not _regen_clicked)
                     result = designer.design(explore_problem.strip())
 
                 if not result["agents"]:
@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -41,6 +42,23 @@ OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 # Model / deployment name
 MODEL = os.environ.get("AZURE_OPENAI_DEPLOYMENT", "gpt-4.1-mini")
 
+# Deployment for concise workroom turns (~150-word replies). Defaults to MODEL;
+# point it at a smaller, faster deployment only after the workroom eval suite
+# (Tests/eval_workroom_suite.py) scores it no worse than MODEL.
+CONCISE_MODEL = os.environ.get("AZURE_OPENAI_CONCISE_DEPLOYMENT", MODEL)
+
+# Embedding model / deployment (used by the AgentDesigner semantic cache)
+EMBEDDING_MODEL = os.environ.get("AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small")
+
+# Per-request timeout (seconds) for every LLM client. Retries (max_retries=5)
+# are handled by the OpenAI SDK: exponential backoff with jitter, honouring
+# Retry-After on 429/5xx responses.
+LLM_REQUEST_TIMEOUT = float(os.environ.get("LLM_REQUEST_TIMEOUT", "60"))
+
+# Cap on round-table agent calls in flight at once (process-wide), so
+# concurrent round tables stay under the provider's rate limits
+MAX_CONCURRENT_AGENT_CALLS = int(os.environ.get("MAX_CONCURRENT_AGENT_CALLS", "8"))
+
 APP_TITLE = "PM Agent"
 APP_ICON = "🧭"
 
@@ -66,6 +84,19 @@ def has_valid_credentials() -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_http_client():
+    """One pooled, thread-safe httpx client for the direct SDK clients.
+
+    Sync only, so it is not given to get_agno_model(): the same Agno model
+    serves arun(), which needs an AsyncClient, and Agno already keeps its
+    own default pooled clients for both paths.
+    """
+    import httpx  # installed with openai
+    return httpx.Client(timeout=LLM_REQUEST_TIMEOUT, follow_redirects=True)
+
+
+@functools.lru_cache(maxsize=1)
 def make_openai_client():
     """
     Return an AzureOpenAI client (default) or a standard OpenAI client.
@@ -73,6 +104,9 @@ def make_openai_client():
     Azure OpenAI is the primary path.  Set AZURE_OPENAI_ENDPOINT and
     AZURE_OPENAI_KEY (or OPENAI_API_KEY) in your environment / .env.
     If AZURE_OPENAI_ENDPOINT is *not* set, falls back to standard OpenAI.
+
+    The client is built once per process and shared: it is thread-safe, and
+    sharing it means every caller reuses one HTTP connection pool.
     """
     if AZURE_OPENAI_ENDPOINT:
         from openai import AzureOpenAI
@@ -82,35 +116,50 @@ def make_openai_client():
             azure_endpoint=AZURE_OPENAI_ENDPOINT,
             api_version=AZURE_OPENAI_API_VERSION,
             max_retries=5,
-            timeout=60.0,
+            timeout=LLM_REQUEST_TIMEOUT,
+            http_client=_shared_http_client(),
         )
     from openai import OpenAI
-    return OpenAI(api_key=OPENAI_API_KEY, max_retries=5, timeout=60.0)
+    return OpenAI(
+        api_key=OPENAI_API_KEY,
+        max_retries=5,
+        timeout=LLM_REQUEST_TIMEOUT,
+        http_client=_shared_http_client(),
+    )
 
 
-def get_agno_model(max_tokens: int | None = None):
+def get_agno_model(max_tokens: int | None = None, json_mode: bool = False, model: str | None = None):
     """
     Return an Agno model instance configured for the current environment.
 
     Uses AzureOpenAI when AZURE_OPENAI_ENDPOINT is set, otherwise standard
-    OpenAI. The model/deployment name comes from the MODEL constant.
+    OpenAI. The model/deployment name is *model*, defaulting to MODEL.
+    With json_mode the request sets response_format={"type": "json_object"},
+    so the reply is always a single parseable JSON object (the prompt must
+    mention JSON).
     """
+    model = model or MODEL
+    request_params = {"response_format": {"type": "json_object"}} if json_mode else None
     if AZURE_OPENAI_ENDPOINT:
         from agno.models.azure import AzureOpenAI as AgnoAzure
         _key = AZURE_OPENAI_KEY or OPENAI_API_KEY
         return AgnoAzure(
-            id=MODEL,
+            id=model,
             azure_endpoint=AZURE_OPENAI_ENDPOINT,
-            azure_deployment=MODEL,
+            azure_deployment=model,
             api_key=_key,
             api_version=AZURE_OPENAI_API_VERSION,
             max_retries=5,
+            timeout=LLM_REQUEST_TIMEOUT,
             max_completion_tokens=max_tokens,
+            request_params=request_params,
         )
     from agno.models.openai import OpenAIChat
     return OpenAIChat(
-        id=MODEL,
+        id=model,
         api_key=OPENAI_API_KEY,
         max_retries=5,
+        timeout=LLM_REQUEST_TIMEOUT,
         max_completion_tokens=max_tokens,
+        request_params=request_params,
     )
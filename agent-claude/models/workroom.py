@@ -74,6 +74,11 @@ class CustomAgent(BaseModel):
     skill_names: list[str] = Field(default_factory=list)
     created_at: str = Field(default_factory=_now)
 
+    @property
+    def effective_description(self) -> str:
+        """Description for pickers/registries; falls back to the prompt's opening."""
+        return self.description or self.system_prompt[:80]
+
 
 # ------------------------------------------------------------------ #
 # WorkroomSession                                                     #
@@ -110,7 +115,9 @@ class WorkroomSession(BaseModel):
     ai_recommended_agents: list[str] = Field(default_factory=list)  # classifier output
 
     # uploaded document context — persisted so it survives page refreshes
-    # Shape: {"filename": str, "text": str} or None
+    # Shape: {"filename": str, "blob_sha": str, "size": int} (text lives in the
+    # blob store, see StorageManager.resolve_document_context), legacy
+    # {"filename": str, "text": str}, or None
     document_context: Optional[dict] = None
 
     # facilitator agent settings
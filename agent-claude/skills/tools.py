@@ -16,10 +16,20 @@ Usage:
     )
 """
 
+import functools
+import heapq
+import re
 from datetime import datetime, timezone
 
 from agno.run import RunContext
 
+# search_backlog returns only the most relevant matches, not the first N found
+SEARCH_BACKLOG_LIMIT = 10
+_PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+# Longer descriptions are cut to the sentence that mentions the keyword
+SEARCH_BACKLOG_DESC_CHARS = 240
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 def get_current_date() -> str:
     """Returns today's date in ISO 8601 format (YYYY-MM-DD).
@@ -34,8 +44,9 @@ def get_current_date() -> str:
 def search_backlog(run_context: RunContext, keyword: str) -> str:
     """Search the PM's customer request backlog for entries matching a keyword.
 
-    Returns matching requests with their ID, priority, tags, and description.
-    Use this to ground recommendations in real backlog data.
+    Returns the most relevant matching requests (exact tag matches, then
+    keyword frequency, then priority) with their ID, priority, tags, and
+    description. Use this to ground recommendations in real backlog data.
 
     Args:
         keyword: Keyword to search for in request descriptions and tags (case-insensitive).
@@ -47,10 +58,19 @@ def search_backlog(run_context: RunContext, keyword: str) -> str:
     if not keyword.strip():
         return "[search_backlog: keyword must not be empty]"
 
-    requests = storage.list_requests()
+    return _search_backlog_text(storage, storage.requests_version(), keyword)
+
+
+@functools.lru_cache(maxsize=64)
+def _search_backlog_text(storage, version, keyword: str) -> str:
+    """search_backlog's reply, memoised until requests.json changes (*version*).
+
+    Agents in one round table often search the same keyword, and an unchanged
+    backlog yields a byte-identical reply.
+    """
     kw = keyword.strip().lower()
     matches = [
-        r for r in requests
+        r for r in storage.list_requests()
         if kw in r.description.lower()
         or any(kw in t.lower() for t in r.tags)
     ]
@@ -58,16 +78,38 @@ def search_backlog(run_context: RunContext, keyword: str) -> str:
     if not matches:
         return f"No requests found matching '{keyword}'."
 
-    lines = [f"Found {len(matches)} request(s) matching '{keyword}':"]
-    for req in matches[:10]:
-        tag_str = ", ".join(req.tags) if req.tags else "none"
-        lines.append(
-            f"  [{req.id}] {req.priority} | tags: {tag_str} | {req.description}"
+    top = heapq.nsmallest(SEARCH_BACKLOG_LIMIT, matches, key=lambda r: _backlog_relevance(r, kw))
+
+    header = f"Found {len(matches)} request(s) matching '{keyword}':\n"
+    body = "\n".join(
+        f"  [{req.id}] {req.priority}"
+        + (f" | tags: {', '.join(req.tags)}" if req.tags else "")
+        + f" | {_excerpt(req.description, kw)}"
+        for req in top
+    )
+    if len(matches) > SEARCH_BACKLOG_LIMIT:
+        body += (
+            f"\n  ... and {len(matches) - SEARCH_BACKLOG_LIMIT} more "
+            f"(showing the {SEARCH_BACKLOG_LIMIT} most relevant)."
         )
-    if len(matches) > 10:
-        lines.append(f"  ... and {len(matches) - 10} more (showing first 10).")
+    return header + body
 
-    return "\n".join(lines)
+
+def _excerpt(text: str, kw: str, max_chars: int = SEARCH_BACKLOG_DESC_CHARS) -> str:
+    """*text* if short, else its first sentence mentioning *kw*, cut to *max_chars*."""
+    if len(text) <= max_chars:
+        return text
+    sentences = _SENTENCE_END_RE.split(text)
+    excerpt = next((s for s in sentences if kw in s.lower()), sentences[0])
+    if len(excerpt) > max_chars:
+        excerpt = excerpt[:max_chars].rsplit(" ", 1)[0]
+    return excerpt + " …"
+
+
+def _backlog_relevance(req, kw: str) -> tuple:
+    """Sort key for search_backlog (lower = more relevant)."""
+    exact_tag = any(t.lower() == kw for t in req.tags)
+    return (not exact_tag, -req.description.lower().count(kw), _PRIORITY_RANK.get(req.priority, 4))
 
 
 def get_recent_insights(run_context: RunContext, limit: int = 5) -> str:
@@ -8,11 +8,16 @@ Files:
   data/workrooms.json       — list[WorkroomSession]
   data/workroom_msgs.json   — list[dict]  (messages tagged by workroom_id)
   data/custom_agents.json   — list[CustomAgent]
+  data/blobs/<sha256>.txt   — content-addressed document text (see put_blob)
 """
 
+import functools
+import hashlib
 import json
+import logging
 import os
 import tempfile
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -23,6 +28,13 @@ from models.strategic_insight import StrategicInsight
 from models.workroom import WorkroomSession, CustomAgent, Decision, GeneratedOutput
 from config import DATA_DIR
 
+try:  # C-accelerated JSON; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -33,8 +45,12 @@ def _atomic_write(path: Path, data: list[dict]) -> None:
     dir_ = path.parent
     fd, tmp_path = tempfile.mkstemp(dir=dir_, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         os.replace(tmp_path, path)
     except Exception:
         try:
@@ -47,10 +63,18 @@ def _atomic_write(path: Path, data: list[dict]) -> None:
 def _load_json(path: Path) -> list[dict]:
     if not path.exists():
         return []
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=16)
+def _read_blob(path: Path) -> str:
+    # Blobs are content-addressed and never rewritten, so caching is safe
+    return path.read_text(encoding="utf-8")
+
+
 class StorageManager:
     """Single access point for all persistent storage."""
 
@@ -58,6 +82,9 @@ class StorageManager:
     DAY_PLANS_FILE = DATA_DIR / "day_plans.json"
     INSIGHTS_FILE = DATA_DIR / "insights.json"
 
+    # Parsed requests.json shared by every instance: (version, records)
+    _requests_cache: tuple[tuple[int, int], tuple[dict, ...]] = ((-1, -1), ())
+
     # ------------------------------------------------------------------ #
     # CustomerRequest                                                      #
     # ------------------------------------------------------------------ #
@@ -75,8 +102,36 @@ class StorageManager:
         _atomic_write(self.REQUESTS_FILE, records)
         return req
 
+    def requests_version(self) -> tuple[int, int]:
+        """Return a cheap change token (mtime in ns, size) for requests.json."""
+        try:
+            st = self.REQUESTS_FILE.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _request_records(self) -> tuple[dict, ...]:
+        """Raw request records, re-parsed only when requests.json changes.
+
+        The records are shared between calls, so treat them as read-only —
+        writers still go through _load_json for a private copy.
+        """
+        version = self.requests_version()
+        cached_version, records = StorageManager._requests_cache
+        if cached_version != version:
+            records = tuple(_load_json(self.REQUESTS_FILE))
+            StorageManager._requests_cache = (version, records)
+        return records
+
+    def count_requests(self, *, include_deleted: bool = False) -> int:
+        """Number of requests, without building CustomerRequest objects."""
+        records = self._request_records()
+        if include_deleted:
+            return len(records)
+        return sum(1 for r in records if not r.get("deleted", False))
+
     def get_request(self, request_id: str) -> Optional[CustomerRequest]:
-        for r in _load_json(self.REQUESTS_FILE):
+        for r in self._request_records():
             if r["id"] == request_id and not r.get("deleted", False):
                 return CustomerRequest(**r)
         return None
@@ -90,7 +145,7 @@ class StorageManager:
         include_deleted: bool = False,
     ) -> list[CustomerRequest]:
         results = []
-        for r in _load_json(self.REQUESTS_FILE):
+        for r in self._request_records():
             if not include_deleted and r.get("deleted", False):
                 continue
             req = CustomerRequest(**r)
@@ -166,11 +221,13 @@ class StorageManager:
             if item.source_type == "insight" and item.source_ref:
                 insight_ids_in_plan.add(item.source_ref)
 
+        flagged = []
         for iid in insight_ids_in_plan:
             ins = self.get_insight(iid)
             if ins and not ins.in_day_plan:
                 ins.in_day_plan = True
-                self.save_insight(ins)
+                flagged.append(ins)
+        self.save_insights(flagged)
 
     def get_day_plan(self, date: str) -> Optional[DayPlan]:
         """Return the most recent DayPlan for a given YYYY-MM-DD date."""
@@ -211,20 +268,41 @@ class StorageManager:
     # ------------------------------------------------------------------ #
 
     def save_insight(self, insight: StrategicInsight) -> StrategicInsight:
+        return self.save_insights([insight])[0]
+
+    def save_insights(self, insights: list[StrategicInsight]) -> list[StrategicInsight]:
+        """Upsert several insights with one write to insights.json and at most
+        one to requests.json, however many insights or links there are."""
+        if not insights:
+            return insights
         records = _load_json(self.INSIGHTS_FILE)
-        updated = False
-        for i, r in enumerate(records):
-            if r["id"] == insight.id:
-                records[i] = insight.model_dump()
-                updated = True
-                break
-        if not updated:
-            records.append(insight.model_dump())
+        index = {r["id"]: i for i, r in enumerate(records)}
+        for ins in insights:
+            i = index.get(ins.id)
+            if i is None:
+                index[ins.id] = len(records)
+                records.append(ins.model_dump())
+            else:
+                records[i] = ins.model_dump()
         _atomic_write(self.INSIGHTS_FILE, records)
         # Bidirectional link: update all referenced requests
-        for rid in insight.linked_request_ids:
-            self.link_request_to_insight(rid, insight.id)
-        return insight
+        self._link_requests_to_insights(insights)
+        return insights
+
+    def _link_requests_to_insights(self, insights: list[StrategicInsight]) -> None:
+        links = [(rid, ins.id) for ins in insights for rid in ins.linked_request_ids]
+        if not links:
+            return
+        records = _load_json(self.REQUESTS_FILE)
+        live = {r["id"]: r for r in records if not r.get("deleted", False)}
+        changed = False
+        for rid, iid in links:
+            r = live.get(rid)
+            if r is not None and iid not in r.setdefault("linked_insight_ids", []):
+                r["linked_insight_ids"].append(iid)
+                changed = True
+        if changed:
+            _atomic_write(self.REQUESTS_FILE, records)
 
     def get_insight(self, insight_id: str) -> Optional[StrategicInsight]:
         for r in _load_json(self.INSIGHTS_FILE):
@@ -294,6 +372,40 @@ class StorageManager:
                 return WorkroomSession(**r)
         return None
 
+    def get_workroom_by_title(
+        self, title: str, include_archived: bool = False
+    ) -> Optional[WorkroomSession]:
+        """Return the most recent workroom with an exact title match.
+
+        Matches on the raw records so only the hit is deserialised.
+        """
+        match = None
+        for r in _load_json(self.WORKROOMS_FILE):
+            if r.get("title") != title:
+                continue
+            if not include_archived and r.get("status") == "archived":
+                continue
+            if match is None or r.get("created_at", "") > match.get("created_at", ""):
+                match = r
+        return WorkroomSession(**match) if match else None
+
+    def find_workroom_with_document_context(
+        self, include_archived: bool = True
+    ) -> Optional[WorkroomSession]:
+        """Return the most recent workroom that has a document and active agents.
+
+        Filters on the raw records so only the hit is deserialised.
+        """
+        match = None
+        for r in _load_json(self.WORKROOMS_FILE):
+            if not (r.get("document_context") and r.get("active_agents")):
+                continue
+            if not include_archived and r.get("status") == "archived":
+                continue
+            if match is None or r.get("created_at", "") > match.get("created_at", ""):
+                match = r
+        return WorkroomSession(**match) if match else None
+
     def list_workrooms(self, include_archived: bool = False) -> list[WorkroomSession]:
         results = []
         for r in _load_json(self.WORKROOMS_FILE):
@@ -328,6 +440,63 @@ class StorageManager:
             return True
         return False
 
+    # ------------------------------------------------------------------ #
+    # Document blobs                                                      #
+    # ------------------------------------------------------------------ #
+
+    BLOBS_DIR = DATA_DIR / "blobs"
+
+    def put_blob(self, text: str) -> str:
+        """Store *text* content-addressed and return its sha256 hex digest."""
+        sha = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self.BLOBS_DIR / f"{sha}.txt"
+        if not path.exists():
+            self.BLOBS_DIR.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.BLOBS_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        return sha
+
+    def load_blob(self, sha: str) -> str:
+        """Return the text stored under *sha*, or "" (with a warning) if the blob is missing."""
+        try:
+            return _read_blob(self.BLOBS_DIR / f"{sha}.txt")
+        except FileNotFoundError:
+            logger.warning("Document blob %s is missing; the document text is lost", sha)
+            return ""
+
+    def store_document_context(self, document_context: Optional[dict]) -> Optional[dict]:
+        """Return a persistable document_context with the text moved to a blob.
+
+        Shape: {"filename": str, "blob_sha": str, "size": int}.
+        """
+        if not document_context or "text" not in document_context:
+            return document_context
+        stored = {k: v for k, v in document_context.items() if k != "text"}
+        stored["blob_sha"] = self.put_blob(document_context["text"])
+        stored["size"] = len(document_context["text"])
+        return stored
+
+    def resolve_document_context(self, document_context: Optional[dict]) -> Optional[dict]:
+        """Return document_context with its "text" loaded from the blob store.
+
+        Legacy records that still carry inline text are returned unchanged.
+        """
+        if not document_context or "text" in document_context:
+            return document_context
+        sha = document_context.get("blob_sha")
+        if not sha:
+            return document_context
+        return {**document_context, "text": self.load_blob(sha)}
+
     # ------------------------------------------------------------------ #
     # Per-workroom messages                                               #
     # ------------------------------------------------------------------ #
@@ -348,6 +517,21 @@ class StorageManager:
         all_msgs = _load_json(self.WORKROOM_MSGS_FILE)
         return [m for m in all_msgs if m.get("workroom_id") == workroom_id]
 
+    def load_recent_workroom_messages(self, workroom_id: str, limit: int = 50) -> list[dict]:
+        """Return only the last *limit* messages for a workroom (oldest first)."""
+        recent: deque[dict] = deque(maxlen=max(0, limit))
+        for m in _load_json(self.WORKROOM_MSGS_FILE):
+            if m.get("workroom_id") == workroom_id:
+                recent.append(m)
+        return list(recent)
+
+    def count_workroom_messages(self, workroom_id: str) -> int:
+        """Count a workroom's messages without building the filtered list."""
+        return sum(
+            1 for m in _load_json(self.WORKROOM_MSGS_FILE)
+            if m.get("workroom_id") == workroom_id
+        )
+
     # ------------------------------------------------------------------ #
     # Custom agents                                                       #
     # ------------------------------------------------------------------ #
@@ -368,6 +552,13 @@ class StorageManager:
     def list_custom_agents(self) -> list[CustomAgent]:
         return [CustomAgent(**r) for r in _load_json(self.CUSTOM_AGENTS_FILE)]
 
+    def custom_agents_version(self) -> int:
+        """Return a cheap change token (file mtime in ns) for custom_agents.json."""
+        try:
+            return self.CUSTOM_AGENTS_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
     def delete_custom_agent(self, agent_id: str) -> bool:
         records = _load_json(self.CUSTOM_AGENTS_FILE)
         new_records = [r for r in records if r["id"] != agent_id]
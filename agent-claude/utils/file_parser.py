@@ -7,32 +7,38 @@ Supports: .md / .txt (briefing), .csv, .pdf, .docx
 import csv
 import io
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
 
 
 def extract_text_from_file(
-    source: Union[str, bytes, Path],
+    source: Union[str, bytes, Path, BinaryIO],
     filename: str = "",
 ) -> str:
     """
     Extract raw text from a file.
 
     Args:
-        source: File path (str/Path) or raw bytes.
-        filename: Used to infer file type when source is bytes.
+        source: File path (str/Path), raw bytes, or a seekable binary stream
+                (open file / mmap). PDFs are parsed straight from the stream
+                without copying it into a bytes object first.
+        filename: Used to infer file type when source is bytes or a stream.
 
     Returns:
         Extracted text content.
     """
-    if isinstance(source, (str, Path)):
+    ext = Path(filename or (source if isinstance(source, (str, Path)) else "")).suffix.lower()
+
+    if hasattr(source, "read"):
+        if ext == ".pdf":
+            return _extract_pdf(source)
+        data = source.read()
+    elif isinstance(source, (str, Path)):
         path = Path(source)
         filename = filename or path.name
         data = path.read_bytes()
     else:
         data = source
 
-    ext = Path(filename).suffix.lower()
-
     if ext in (".md", ".txt", ""):
         return data.decode("utf-8", errors="replace")
 
@@ -49,11 +55,12 @@ def extract_text_from_file(
     return data.decode("utf-8", errors="replace")
 
 
-def _extract_pdf(data: bytes) -> str:
+def _extract_pdf(data: Union[bytes, BinaryIO]) -> str:
     try:
         from pypdf import PdfReader
 
-        reader = PdfReader(io.BytesIO(data))
+        stream = data if hasattr(data, "read") else io.BytesIO(data)
+        reader = PdfReader(stream)
         pages = []
         for page in reader.pages:
             text = page.extract_text()